@@ -46,6 +46,9 @@ Dépendances
 -----------
 - Python 3.8+
 - matplotlib
+- numpy
+- numba (optionnel, accélère le parsing des scans continus)
+- orjson (optionnel, accélère la lecture/écriture des préférences)
 - tkinter (standard library)
 
 Licence
@@ -55,20 +58,49 @@ Ce script est fourni tel quel, sans garantie. À adapter selon votre contexte QA
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
 import re
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import matplotlib
-import matplotlib.pyplot as plt
+# Fenêtre interactive en TkAgg (l'export passe par Agg directement), sauf si
+# l'utilisateur a choisi un backend (MPLBACKEND ou matplotlibrc)
+if "MPLBACKEND" not in os.environ and dict.get(matplotlib.rcParams, "backend") is getattr(
+        matplotlib.rcsetup, "_auto_backend_sentinel", None):
+    matplotlib.use("TkAgg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 
+try:  # Numba optionnel : parsing compilé des blocs de données
+    from numba import njit
+except ImportError:  # pragma: no cover - repli NumPy si Numba est absent
+    njit = None
+
+try:  # orjson optionnel : lecture/écriture plus rapide des préférences
+    import orjson
+except ImportError:  # pragma: no cover - repli sur le module json standard
+    orjson = None
+
 # ======================== Dataviz ============================================
 
-matplotlib.rcParams.update({
+PLOT_STYLE = {
     "font.family": "DejaVu Sans",
     "font.size": 12,
     "axes.titlesize": 20,
@@ -84,7 +116,8 @@ matplotlib.rcParams.update({
     "grid.color": "#cccccc",
     "grid.linewidth": 0.7,
     "axes.grid": True,
-})
+}
+matplotlib.style.use(PLOT_STYLE)
 
 # ======================== Constantes =========================================
 
@@ -92,8 +125,14 @@ APP_TITLE = "Comparateur MCC – PDD / Profil"
 WINDOW_GEOMETRY = "1180x700"
 WINDOW_MIN_WIDTH = 980
 WINDOW_MIN_HEIGHT = 560
+VAR_CHANGE_DEBOUNCE_MS = 300  # délai avant sauvegarde des options (frappe au clavier…)
+TREE_INSERT_CHUNK = 500  # lignes insérées par cycle idle pour les grosses listes
+TREE_FREEZE_MIN_ROWS = 50  # en dessous, masquer/réafficher les colonnes coûte plus que la mise à jour
 
 PREFS_PATH = Path.home() / ".mcc_plotter_prefs.json"
+PARSE_CACHE_DIR = Path.home() / ".mcc_plotter_cache"  # résultats de parsing (npz)
+PARSE_CACHE_MAX_FILES = 500  # au-delà, les entrées les moins récemment utilisées sont supprimées
+PARSE_CACHE_TMP_MAX_AGE_S = 24 * 3600  # fichiers temporaires orphelins (écriture interrompue)
 
 # Clés de préférences
 PREF_KEY_FILES = "files"      # par-fichier (clé = chemin absolu du fichier)
@@ -134,6 +173,10 @@ PLOT_SIZE = (10, 6)
 EXPORT_DPI = 300
 LINEWIDTH = 2.0
 MARKERSIZE = 5
+LEGEND_LOC = "upper right"  # emplacement fixe : 'best' est très lent avec beaucoup de points
+
+# Courbe à tracer : (xs, ys, couleur, style de ligne, marqueur, libellé)
+Curve = Tuple[np.ndarray, np.ndarray, str, str, str, str]
 
 # UI
 SYMBOL_INCLUDE = "✔"
@@ -158,33 +201,49 @@ PARAMS: List[Tuple[str, str]] = [
     ("Orientation", "Orientation détecteur"),
 ]
 
+PARAM_KEYS: Tuple[str, ...] = tuple(k for k, _ in PARAMS)
+PARAM_LABELS: Dict[str, str] = dict(PARAMS)
+# Choix du paramètre secondaire (marqueur) : vide + tous sauf le paramètre couleur
+MARKER_KEYS_MINUS: Dict[str, Tuple[str, ...]] = {
+    k: ("",) + tuple(x for x in PARAM_KEYS if x != k) for k in PARAM_KEYS
+}
+
+# Colonnes du tableau : réglages par fichier, paramètres, nom du fichier
+TABLE_COLUMNS: Tuple[str, ...] = ("include", "x_shift", "y_scale", "y_offset") + PARAM_KEYS + ("file",)
+
 DEFAULT_SAD_CM = 100.0
 
 # ======================== Utilitaires ========================================
 
 
-def normalize(values: Iterable[float]) -> List[float]:
+def normalize(values: Sequence[float]) -> np.ndarray:
     """
     Normaliser une séquence de valeurs sur [0, 1] en divisant par le maximum.
 
-    :param values: Itérable de valeurs numériques.
-    :type values: Iterable[float]
-    :return: Liste normalisée (vide si `values` est vide).
-    :rtype: List[float]
+    :param values: Séquence (ou tableau NumPy) de valeurs numériques.
+    :type values: Sequence[float]
+    :return: Tableau normalisé (vide si `values` est vide, inchangé si max = 0).
+        Un tableau float32 reste en float32.
+    :rtype: np.ndarray
     """
-    vals = list(values)
-    if not vals:
-        return []
-    maximum = max(vals)
+    arr = np.asarray(values)
+    if arr.dtype != np.float32:
+        arr = arr.astype(np.float64, copy=False)
+    if arr.size == 0:
+        return arr
+    maximum = arr.max()
     if maximum == 0:
-        return vals
-    return [v / maximum for v in vals]
+        return arr
+    return arr / maximum
 
 
 def _as_float(txt: Optional[str]) -> Optional[float]:
     """
     Convertir une chaîne vers float en prenant en charge la virgule décimale.
 
+    Chemin rapide : `float()` direct (cas courant des en-têtes MCC) ; le
+    nettoyage (espaces, virgule) n'est fait qu'en cas d'échec.
+
     :param txt: Chaîne à convertir (peut être None).
     :type txt: Optional[str]
     :return: Nombre flottant, ou None si conversion invalide.
@@ -192,12 +251,52 @@ def _as_float(txt: Optional[str]) -> Optional[float]:
     """
     if txt is None:
         return None
+    try:
+        return float(txt)
+    except (TypeError, ValueError):
+        pass
     try:
         return float(str(txt).strip().replace(",", "."))
     except ValueError:
         return None
 
 
+_DEPTH_SEP_RE = re.compile(r"[,;]+")  # séparateurs des listes saisies (ex. profondeurs)
+
+
+@functools.lru_cache(maxsize=256)
+def _csv_to_array(txt: str) -> np.ndarray:
+    """
+    Parser une chaîne CSV (séparateurs ',' ou ';') en tableau de flottants.
+
+    Chemin rapide : conversion NumPy en une fois, retenue seulement si aucun
+    token n'est vide et si elle rend autant de valeurs que de tokens
+    (`np.fromstring` lit un token blanc comme -1 et, avant NumPy 2, tronque
+    au premier token invalide au lieu de lever ValueError). Sinon, repli sur
+    une conversion token par token qui ignore les tokens invalides. Le résultat est mis en
+    cache (une même chaîne, ex. REF_SCAN_POSITIONS, n'est parsée qu'une fois)
+    et retourné en lecture seule.
+
+    :param txt: Chaîne CSV.
+    :type txt: str
+    :return: Tableau float64 non modifiable (tokens non-numériques ignorés).
+    :rtype: np.ndarray
+    """
+    norm = str(txt).replace(";", ",")
+    parts = norm.split(",")
+    arr = None
+    if all(part.strip() for part in parts):
+        try:
+            arr = np.fromstring(norm, sep=",", dtype=np.float64)
+        except ValueError:
+            pass
+    if arr is None or arr.size != len(parts):
+        vals = [_as_float(part) for part in parts]
+        arr = np.asarray([v for v in vals if v is not None], dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+
 def _parse_depth_csv_cm(txt: str) -> List[float]:
     """
     Parser une chaîne CSV de profondeurs (en cm). Les duplicats (à 2 décimales)
@@ -208,197 +307,698 @@ def _parse_depth_csv_cm(txt: str) -> List[float]:
     :return: Liste des profondeurs uniques en cm.
     :rtype: List[float]
     """
-    raw: List[float] = []
-    for part in str(txt).replace(";", ",").split(","):
-        val = _as_float(part)
-        if val is not None:
-            raw.append(val)
-    seen = set()
-    out: List[float] = []
-    for depth in raw:
-        key = round(depth, 2)
-        if key not in seen:
-            seen.add(key)
-            out.append(depth)
-    return out
+    arr = _csv_to_array(str(txt))
+    if arr.size == 0:
+        return []
+    _, first_idx = np.unique(np.round(arr, 2), return_index=True)
+    return arr[np.sort(first_idx)].tolist()
 
 
-def _parse_csv_floats(txt: str) -> List[float]:
+class _DepthIndex:
     """
-    Parser une chaîne CSV quelconque en liste de flottants.
+    Index des profils d'une orientation, trié par profondeur (mm), pour
+    retrouver par recherche dichotomique les courbes à ±0.5 mm d'une cible
+    au lieu de parcourir toute la liste à chaque profondeur.
 
-    :param txt: Chaîne CSV, séparateurs ',' ou ';'.
-    :type txt: str
-    :return: Liste de floats (les tokens non-numériques sont ignorés).
-    :rtype: List[float]
+    Les comparaisons se font en mm (unité du fichier) : la cible en cm est
+    ramenée en mm et arrondie au µm, ce qui évite qu'un écart de 0.5 mm
+    tombe hors tolérance à cause de l'arithmétique flottante en cm.
     """
-    out: List[float] = []
-    for part in str(txt).replace(";", ",").split(","):
-        val = _as_float(part)
-        if val is not None:
-            out.append(val)
-    return out
+
+    TOLERANCE_MM = 0.5
+
+    def __init__(self, seq: Sequence[Dict[str, object]]) -> None:
+        """
+        :param seq: Liste d'objets courbe {'depth_mm','xs','ys'} ; ceux sans profondeur sont ignorés.
+        :type seq: Sequence[Dict[str, object]]
+        """
+        self._curves = [e for e in seq if e.get("depth_mm") is not None]
+        depths_mm = np.array([e["depth_mm"] for e in self._curves], dtype=np.float64)
+        self._order = np.argsort(depths_mm, kind="stable")
+        self._depths_mm = depths_mm[self._order]
+
+    def match(self, target_cm: float) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Courbes dont la profondeur ≈ target_cm, dans l'ordre du fichier.
+
+        :param target_cm: Profondeur visée (cm).
+        :type target_cm: float
+        :return: Liste de paires (xs, ys).
+        :rtype: List[Tuple[np.ndarray, np.ndarray]]
+        """
+        target_mm = round(target_cm * 10.0, 3)
+        lo = np.searchsorted(self._depths_mm, target_mm - self.TOLERANCE_MM, side="left")
+        hi = np.searchsorted(self._depths_mm, target_mm + self.TOLERANCE_MM, side="right")
+        return [(self._curves[i]["xs"], self._curves[i]["ys"]) for i in np.sort(self._order[lo:hi])]
 
 
 # ======================== Parsing MCC ========================================
 
-KV_RE = re.compile(r"^\s*([A-Za-z0-9_]+)\s*=\s*(.+?)\s*$")
+# Ligne "CLE=valeur" (octets) ; utilisable ligne à ligne ou via findall sur tout le fichier
+KV_RE = re.compile(rb"^[ \t]*([A-Za-z0-9_]+)[ \t]*=[ \t]*(\S[^\r\n]*?)[ \t\r]*$", re.MULTILINE)
+# Points de transition du parseur, recherchés sur les octets bruts du fichier
+HEADER_RE = re.compile(
+    rb"^[ \t]*(SCAN_CURVETYPE|SCAN_DEPTH|BEGIN_DATA|END_DATA)[ \t]*(?:=[ \t]*([^\r\n]*?))?[ \t]*\r?$",
+    re.MULTILINE,
+)
+DETECTOR_RE = re.compile(r"\bT([A-Za-z0-9\-]+)\b")
+# Entrée "@z cm : X*Y" de la colonne FOV agrégée (cf. `_fov_string_from`)
+FOV_ENTRY_RE = re.compile(r"@(-?[0-9]+(?:\.[0-9]+)?)\s*cm\s*:\s*([0-9.,]+)\*([0-9.,]+)")
 
 
-def _scan_keyvals(lines: List[str]) -> Dict[str, str]:
+def _scan_keyvals(data: bytes) -> Dict[str, str]:
     """
-    Extraire des paires clé/valeur à partir des lignes entêtes d'un MCC.
+    Extraire les paires clé/valeur des lignes d'entête d'un MCC.
+
+    Le motif est appliqué sur les octets bruts (MCC = ASCII) ; seules les
+    clés et valeurs retenues sont décodées.
 
-    :param lines: Lignes du fichier MCC.
-    :type lines: List[str]
+    :param data: Contenu brut du fichier MCC.
+    :type data: bytes
     :return: Dictionnaire des métadonnées (clé en MAJUSCULES).
     :rtype: Dict[str, str]
     """
-    kv: Dict[str, str] = {}
-    for raw in lines:
-        if "BEGIN_DATA" in raw or "END_DATA" in raw:
+    return {
+        key.decode("ascii").upper(): value.decode("utf-8", errors="ignore")
+        for key, value in KV_RE.findall(data)
+    }
+
+
+PARSE_CACHE_SIZE = 128
+PARSE_CACHE_VERSION = 2  # à incrémenter si le format du cache disque change
+PROFILE_Y_DTYPE = np.float32  # lectures détecteur des profils : float32 suffit (moitié de mémoire)
+PARSE_WORKERS = min(8, os.cpu_count() or 1)  # fichiers parsés en parallèle
+PROFILE_KINDS = {"INPLANE_PROFILE": "inplane", "CROSSPLANE_PROFILE": "crossplane"}
+
+
+_POW10 = np.array([float(10 ** k) for k in range(23)])  # puissances de 10 exactes en float64
+
+
+def _scan_number(buf: np.ndarray, i: int, n: int) -> Tuple[float, int, bool]:
+    """
+    Lire un nombre décimal ASCII dans `buf` à partir de la position `i`.
+
+    Machine à états signe / partie entière / fraction / exposant. Seul le cas
+    exact est accepté (≤ 15 chiffres significatifs, |exposant| ≤ 22 : une seule
+    opération flottante, donc arrondi correct) ; sinon `ok` vaut False et
+    l'appelant se replie sur le parsing NumPy.
+
+    :param buf: Octets du bloc (uint8).
+    :type buf: np.ndarray
+    :param i: Position de départ.
+    :type i: int
+    :param n: Taille de `buf`.
+    :type n: int
+    :return: (valeur, position après le nombre, ok)
+    :rtype: Tuple[float, int, bool]
+    """
+    neg = False
+    if i < n and (buf[i] == 43 or buf[i] == 45):  # '+' / '-'
+        neg = buf[i] == 45
+        i += 1
+    mant = 0
+    sig = 0
+    ndigits = 0
+    exp10 = 0
+    in_frac = False
+    while i < n:
+        c = int(buf[i])
+        if 48 <= c <= 57:
+            d = c - 48
+            if mant != 0 or d != 0:
+                if sig >= 15:
+                    return 0.0, i, False
+                mant = mant * 10 + d
+                sig += 1
+            if in_frac:
+                exp10 -= 1
+            ndigits += 1
+        elif c == 46 and not in_frac:  # '.'
+            in_frac = True
+        else:
+            break
+        i += 1
+    if ndigits == 0:
+        return 0.0, i, False
+    if i < n and (buf[i] == 101 or buf[i] == 69):  # 'e' / 'E'
+        i += 1
+        eneg = False
+        if i < n and (buf[i] == 43 or buf[i] == 45):
+            eneg = buf[i] == 45
+            i += 1
+        e = 0
+        edigits = 0
+        while i < n and 48 <= buf[i] <= 57:
+            if e < 10000:
+                e = e * 10 + (int(buf[i]) - 48)
+            edigits += 1
+            i += 1
+        if edigits == 0:
+            return 0.0, i, False
+        exp10 += -e if eneg else e
+    if i < n and not (buf[i] == 32 or buf[i] == 9 or buf[i] == 13 or buf[i] == 10):
+        return 0.0, i, False
+    if mant == 0:
+        value = 0.0
+    elif 0 <= exp10 <= 22:
+        value = float(mant) * _POW10[exp10]
+    elif -22 <= exp10 < 0:
+        value = float(mant) / _POW10[-exp10]
+    else:
+        return 0.0, i, False
+    return (-value if neg else value), i, True
+
+
+def _parse_two_col(buf: np.ndarray) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Tokeniser et convertir les deux premières colonnes d'un bloc en une passe.
+
+    Les tableaux de sortie sont préalloués d'après le nombre de sauts de ligne ;
+    les colonnes au-delà de la deuxième sont ignorées. Toute ligne non triviale
+    (une seule colonne, token non numérique, nombre hors cas exact) invalide le
+    résultat (`ok` = False) pour laisser le repli conserver la sémantique
+    habituelle.
+
+    :param buf: Octets du bloc (uint8).
+    :type buf: np.ndarray
+    :return: (xs, ys, ok)
+    :rtype: Tuple[np.ndarray, np.ndarray, bool]
+    """
+    n = buf.size
+    cap = 1
+    for k in range(n):
+        if buf[k] == 10:
+            cap += 1
+    xs = np.empty(cap)
+    ys = np.empty(cap)
+    nrow = 0
+    i = 0
+    while i < n:
+        while i < n and (buf[i] == 32 or buf[i] == 9 or buf[i] == 13):
+            i += 1
+        if i >= n:
+            break
+        if buf[i] == 10:
+            i += 1
             continue
-        match = KV_RE.match(raw)
-        if match:
-            kv[match.group(1).upper()] = match.group(2).strip()
-    return kv
+        x, i, ok = _scan_number(buf, i, n)
+        if not ok:
+            return xs[:0], ys[:0], False
+        while i < n and (buf[i] == 32 or buf[i] == 9):
+            i += 1
+        y, i, ok = _scan_number(buf, i, n)
+        if not ok:
+            return xs[:0], ys[:0], False
+        xs[nrow] = x
+        ys[nrow] = y
+        nrow += 1
+        while i < n and buf[i] != 10:
+            i += 1
+        i += 1
+    return xs[:nrow], ys[:nrow], True
+
+
+if njit is not None:
+    _scan_number = njit(cache=True, nogil=True)(_scan_number)
+    _parse_two_col_compiled = njit(cache=True, nogil=True)(_parse_two_col)
+else:  # pragma: no cover - Numba absent
+    _parse_two_col_compiled = None
+
+
+def _is_rectangular(block: bytes, nrows: int, ncols: int) -> bool:
+    """
+    Vérifier sans boucle Python que chaque ligne du bloc compte exactement
+    `ncols` tokens (un total équilibré ne suffit pas : "1 2 / 3 / 4 5 6"
+    se décalerait au redimensionnement).
+
+    Les octets ≤ 0x20 sont traités comme blancs ; un début de token est un
+    non-blanc précédé d'un blanc. La ligne k doit se terminer après
+    exactement (k + 1) * ncols tokens.
+
+    :param block: Octets du bloc (sans blancs en tête/fin).
+    :type block: bytes
+    :param nrows: Nombre de lignes attendu.
+    :type nrows: int
+    :param ncols: Nombre de tokens attendu par ligne.
+    :type ncols: int
+    :return: True si le bloc est une grille nrows × ncols.
+    :rtype: bool
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    is_ws = buf <= 32
+    starts = np.flatnonzero(is_ws[:-1] > is_ws[1:])  # token commençant en i + 1
+    if starts.size + 1 != nrows * ncols:
+        return False
+    tokens_before_eol = np.searchsorted(starts, np.flatnonzero(buf == 10)) + 1
+    return bool((tokens_before_eol == np.arange(ncols, nrows * ncols, ncols)).all())
 
 
-def parse_mcc_profiles_all(filepath: Path | str) -> Dict[str, List[Dict[str, object]]]:
+def _parse_data_block(block: bytes) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Parser toutes les courbes profil d'un fichier MCC.
+    Convertir le contenu brut d'un bloc BEGIN_DATA/END_DATA en (xs, ys).
+
+    Si Numba est disponible, le noyau compilé `_parse_two_col` fusionne
+    tokenisation et conversion. Sinon (ou s'il refuse le bloc), tout le bloc
+    est converti en une fois par NumPy puis redimensionné selon le nombre de
+    colonnes de la première ligne ; la forme est vérifiée une fois, en NumPy,
+    avant le redimensionnement (`_is_rectangular`). Si le bloc est irrégulier (colonnes variables, lignes
+    vides, tokens non numériques), repli sur un parsing ligne à ligne qui
+    ignore les lignes malformées.
+
+    :param block: Octets compris entre BEGIN_DATA et END_DATA.
+    :type block: bytes
+    :return: (xs, ys) — colonnes 0 et 1, vides si aucune donnée exploitable.
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    block = block.strip()
+    if not block:
+        return np.empty(0), np.empty(0)
+    if _parse_two_col_compiled is not None:
+        xs, ys, ok = _parse_two_col_compiled(np.frombuffer(block, dtype=np.uint8))
+        if ok:
+            return xs, ys
+    ncols = len(block.split(b"\n", 1)[0].split())
+    nrows = block.count(b"\n") + 1
+    if ncols >= 2:
+        try:
+            arr = np.fromstring(block, sep=" ", dtype=np.float64)
+        except ValueError:
+            arr = None
+        if arr is not None and arr.size == nrows * ncols and _is_rectangular(block, nrows, ncols):
+            arr = arr.reshape(nrows, ncols)
+            return arr[:, 0].copy(), arr[:, 1].copy()
 
-    Structure de retour :
-        {
-          "inplane": [
-              {"depth_mm": float|None, "xs": List[float], "ys": List[float]},
-              ...
-          ],
-          "crossplane": [
-              ...
-          ]
-        }
+    xs: List[float] = []
+    ys: List[float] = []
+    for line in block.splitlines():
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                x_val, y_val = float(parts[0]), float(parts[1])
+            except ValueError:
+                # Ignore lignes malformées dans les données
+                continue
+            xs.append(x_val)
+            ys.append(y_val)
+    return np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
 
-    :param filepath: Chemin de fichier .mcc.
-    :type filepath: Path | str
-    :return: Dictionnaire par orientation (absent si aucune courbe de ce type).
-    :rtype: Dict[str, List[Dict[str, object]]]
+
+@dataclass(frozen=True)
+class ParsedFile:
     """
-    path = Path(filepath)
-    try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    except Exception as exc:  # pragma: no cover - robustesse I/O
-        print(f"Erreur d'ouverture {path}: {exc}")
-        return {}
+    Identité hashable d'un fichier MCC parsé, utilisée comme clé de cache.
+
+    L'égalité et le hash ne portent que sur (path, mtime_ns) : un fichier
+    modifié sur disque produit donc une nouvelle clé.
+    """
+
+    path: str
+    mtime_ns: int
+    meta: Dict[str, str] = field(default_factory=dict, compare=False, repr=False)
+    depths_mm: Tuple[float, ...] = field(default=(), compare=False)
+
+
+def _empty_parse_result() -> Dict[str, object]:
+    """
+    Résultat vide de `parse_mcc_all` (fichier illisible ou sans données).
+
+    :return: Dictionnaire {"pdd": (None, None), "profiles": {}, "meta": {}, "file": None}.
+    :rtype: Dict[str, object]
+    """
+    return {"pdd": (None, None), "profiles": {}, "meta": {}, "file": None}
+
+
+def _parse_mcc_bytes(data: bytes) -> Dict[str, object]:
+    """
+    Parser le contenu d'un fichier MCC (métadonnées + PDD + profils).
+
+    Le contenu n'est jamais décodé en bloc : les métadonnées sont extraites
+    par un unique `findall` sur les octets (cf. `_scan_keyvals`) ; les points de
+    transition (SCAN_CURVETYPE, SCAN_DEPTH, BEGIN_DATA, END_DATA) sont
+    localisés par `HEADER_RE.finditer` sur les octets bruts, puis les blocs de
+    données sont découpés par tranches entre BEGIN_DATA et END_DATA. Le PDD
+    correspond au premier bloc complet du fichier, les profils aux blocs dont
+    SCAN_CURVETYPE est INPLANE_PROFILE / CROSSPLANE_PROFILE.
+
+    :param data: Contenu brut du fichier.
+    :type data: bytes
+    :return: Voir `parse_mcc_all`.
+    :rtype: Dict[str, object]
+    """
+    meta = _scan_keyvals(data)
+    profiles: Dict[str, List[Dict[str, object]]] = {"inplane": [], "crossplane": []}
+    pdd: Tuple[Optional[np.ndarray], Optional[np.ndarray]] = (None, None)
 
     current_kind: Optional[str] = None
     current_depth: Optional[float] = None
-    in_data = False
-    xs: List[float] = []
-    ys: List[float] = []
-    result: Dict[str, List[Dict[str, object]]] = {"inplane": [], "crossplane": []}
+    data_start: Optional[int] = None
+    first_block = True
+
+    def on_curvetype(value: str) -> None:
+        """
+        Handler SCAN_CURVETYPE : change l'orientation de la courbe courante.
+
+        :param value: Valeur brute de la clé.
+        :type value: str
+        :return: None
+        :rtype: None
+        """
+        nonlocal current_kind
+        val = value.upper()
+        current_kind = next((kind for tag, kind in PROFILE_KINDS.items() if tag in val), None)
 
-    def commit() -> None:
+    def on_depth(value: str) -> None:
         """
-        Commit interne : pousse la courbe accumulée dans `result`.
+        Handler SCAN_DEPTH : mémorise la profondeur (mm) de la courbe courante.
 
+        :param value: Valeur brute de la clé.
+        :type value: str
         :return: None
         :rtype: None
         """
-        nonlocal xs, ys, current_kind, current_depth
-        if current_kind in ("inplane", "crossplane") and xs and ys:
-            result[current_kind].append({
+        nonlocal current_depth
+        try:
+            current_depth = float(value)
+        except ValueError:
+            current_depth = None
+
+    def commit(block: bytes, as_pdd: bool) -> None:
+        """
+        Commit interne : convertit un bloc et le pousse dans `profiles`
+        (et dans `pdd` s'il s'agit du premier bloc complet du fichier).
+
+        :param block: Octets du bloc de données.
+        :type block: bytes
+        :param as_pdd: True si le bloc doit aussi servir de PDD.
+        :type as_pdd: bool
+        :return: None
+        :rtype: None
+        """
+        nonlocal pdd
+        is_profile = current_kind in ("inplane", "crossplane")
+        if not (as_pdd or is_profile):
+            return
+        xs, ys = _parse_data_block(block)
+        if as_pdd:
+            pdd = (xs if xs.size else None), (ys if ys.size else None)
+        if is_profile and xs.size and ys.size:
+            profiles[current_kind].append({
                 "depth_mm": float(current_depth) if current_depth is not None else None,
-                "xs": xs, "ys": ys
+                "xs": xs, "ys": ys.astype(PROFILE_Y_DTYPE)
             })
-        xs, ys = [], []
-
-    for raw in lines:
-        line = raw.strip()
-
-        if line.startswith("SCAN_CURVETYPE="):
-            if in_data:
-                commit()
-                in_data = False
-            val = line.split("=", 1)[1].strip().upper()
-            if "INPLANE_PROFILE" in val:
-                current_kind = "inplane"
-            elif "CROSSPLANE_PROFILE" in val:
-                current_kind = "crossplane"
-            else:
-                current_kind = None
 
-        elif line.startswith("SCAN_DEPTH="):
-            try:
-                current_depth = float(line.split("=", 1)[1].strip())
-            except ValueError:
-                current_depth = None
+    handlers = {b"SCAN_CURVETYPE": on_curvetype, b"SCAN_DEPTH": on_depth}
+
+    for match in HEADER_RE.finditer(data):
+        token = match.group(1)
+        if token == b"BEGIN_DATA":
+            if data_start is None:
+                data_start = match.end()
+        elif token == b"END_DATA":
+            if data_start is not None:
+                commit(data[data_start:match.start()], as_pdd=first_block)
+                first_block = False
+                data_start = None
+        elif data_start is None:
+            handlers[token]((match.group(2) or b"").decode("ascii", errors="ignore"))
+
+    if data_start is not None:
+        # Bloc non terminé : profil conservé, PDD ignoré
+        commit(data[data_start:], as_pdd=False)
 
-        elif "BEGIN_DATA" in line:
-            in_data = True
-            xs, ys = [], []
+    return {
+        "pdd": pdd,
+        "profiles": {kind: lst for kind, lst in profiles.items() if lst},
+        "meta": meta,
+    }
 
-        elif "END_DATA" in line:
-            if in_data:
-                commit()
-            in_data = False
 
-        elif in_data and current_kind:
-            parts = line.split()
-            if len(parts) >= 2:
+def _parsed_cache_path(path_str: str) -> Path:
+    """
+    Chemin du fichier de cache disque associé à un fichier MCC.
+
+    :param path_str: Chemin du fichier MCC.
+    :type path_str: str
+    :return: Chemin du .npz dans PARSE_CACHE_DIR.
+    :rtype: Path
+    """
+    return PARSE_CACHE_DIR / f"{hashlib.sha1(path_str.encode('utf-8')).hexdigest()}.npz"
+
+
+def _load_parsed_cache(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, object]]:
+    """
+    Relire un résultat de parsing depuis le cache disque.
+
+    Le cache n'est utilisé que si la version du format, la date de
+    modification et la taille du fichier source correspondent.
+
+    :param path_str: Chemin du fichier MCC.
+    :type path_str: str
+    :param mtime_ns: Date de modification (ns) du fichier.
+    :type mtime_ns: int
+    :param size: Taille du fichier (octets).
+    :type size: int
+    :return: Résultat (sans "file") ou None si absent / périmé / illisible.
+    :rtype: Optional[Dict[str, object]]
+    """
+    cache = _parsed_cache_path(path_str)
+    if not cache.is_file():
+        return None
+    try:
+        with np.load(cache, allow_pickle=False) as npz:
+            header = json.loads(str(npz["header"]))
+            if (header.get("version") != PARSE_CACHE_VERSION or header.get("path") != path_str
+                    or header.get("mtime_ns") != mtime_ns or header.get("size") != size):
+                return None
+            pdd = tuple(npz[name] if name in npz.files else None for name in ("pdd_xs", "pdd_ys"))
+            profiles = {
+                kind: [
+                    {"depth_mm": depth_mm, "xs": npz[f"{kind}_{i}_xs"], "ys": npz[f"{kind}_{i}_ys"]}
+                    for i, depth_mm in enumerate(depths)
+                ]
+                for kind, depths in header["profiles"].items()
+            }
+    except Exception:  # pragma: no cover - cache corrompu : on re-parse
+        return None
+    try:
+        os.utime(cache)  # marque l'entrée comme récemment utilisée (élagage LRU)
+    except OSError:  # pragma: no cover
+        pass
+    return {"pdd": pdd, "profiles": profiles, "meta": header["meta"]}
+
+
+def _prune_parsed_cache() -> None:
+    """
+    Borner le cache disque : ne garder que les PARSE_CACHE_MAX_FILES entrées
+    les plus récemment utilisées (date de modification, rafraîchie à chaque
+    lecture) et supprimer les fichiers temporaires orphelins.
+
+    :return: None
+    :rtype: None
+    """
+    cached: List[Tuple[float, str]] = []
+    doomed: List[str] = []
+    now = time.time()
+    try:
+        with os.scandir(PARSE_CACHE_DIR) as it:
+            for entry in it:
                 try:
-                    xs.append(float(parts[0]))
-                    ys.append(float(parts[1]))
-                except ValueError:
-                    # Ignore lignes malformées dans les données
-                    pass
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if entry.name.endswith(".npz"):
+                    cached.append((mtime, entry.path))
+                elif entry.name.endswith(".tmp") and now - mtime > PARSE_CACHE_TMP_MAX_AGE_S:
+                    doomed.append(entry.path)
+    except OSError:  # pragma: no cover - dossier absent / illisible
+        return
+    if len(cached) > PARSE_CACHE_MAX_FILES:
+        cached.sort()
+        doomed.extend(path for _mtime, path in cached[:len(cached) - PARSE_CACHE_MAX_FILES])
+    for path in doomed:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover - déjà supprimé par une autre instance
+            pass
 
-    if in_data:
-        commit()
 
-    if not result["inplane"]:
-        result.pop("inplane", None)
-    if not result["crossplane"]:
-        result.pop("crossplane", None)
+def _save_parsed_cache(path_str: str, mtime_ns: int, size: int, result: Dict[str, object]) -> None:
+    """
+    Écrire un résultat de parsing dans le cache disque (écriture atomique
+    via un fichier temporaire unique), puis élaguer le cache.
+
+    Les erreurs d'écriture sont ignorées : le cache n'est qu'une optimisation.
+
+    :param path_str: Chemin du fichier MCC.
+    :type path_str: str
+    :param mtime_ns: Date de modification (ns) du fichier.
+    :type mtime_ns: int
+    :param size: Taille du fichier (octets).
+    :type size: int
+    :param result: Résultat de `_parse_mcc_bytes`.
+    :type result: Dict[str, object]
+    :return: None
+    :rtype: None
+    """
+    header = {
+        "version": PARSE_CACHE_VERSION, "path": path_str, "mtime_ns": mtime_ns, "size": size,
+        "meta": result["meta"],
+        "profiles": {kind: [d["depth_mm"] for d in lst] for kind, lst in result["profiles"].items()},
+    }
+    arrays = {"header": np.array(json.dumps(header))}
+    for name, arr in zip(("pdd_xs", "pdd_ys"), result["pdd"]):
+        if arr is not None:
+            arrays[name] = arr
+    for kind, lst in result["profiles"].items():
+        for i, d in enumerate(lst):
+            arrays[f"{kind}_{i}_xs"] = d["xs"]
+            arrays[f"{kind}_{i}_ys"] = d["ys"]
+
+    cache = _parsed_cache_path(path_str)
+    tmp_name = None
+    try:
+        PARSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Nom temporaire unique : plusieurs threads / instances peuvent écrire en même temps
+        with tempfile.NamedTemporaryFile(dir=PARSE_CACHE_DIR, prefix=cache.stem + ".",
+                                         suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            np.savez(f, **arrays)
+        os.replace(tmp_name, cache)
+        tmp_name = None
+    except OSError:  # pragma: no cover - cache disque non inscriptible
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.remove(tmp_name)
+            except OSError:  # pragma: no cover
+                pass
+    _prune_parsed_cache()
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_mcc_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, object]:
+    """
+    Lecture unique du fichier puis `_parse_mcc_bytes`, avec mémoïsation.
+
+    En dehors du cache mémoire, le résultat est aussi conservé sur disque
+    (PARSE_CACHE_DIR) pour les sessions suivantes.
+
+    `mtime_ns` et `size` ne servent qu'à la clé de cache : un fichier modifié
+    sur disque est donc re-parsé automatiquement. Les erreurs de lecture ne
+    sont pas interceptées ici (elles seraient mémorisées) mais par
+    `parse_mcc_all`.
+
+    :param path_str: Chemin du fichier MCC.
+    :type path_str: str
+    :param mtime_ns: Date de modification (ns) du fichier.
+    :type mtime_ns: int
+    :param size: Taille du fichier (octets).
+    :type size: int
+    :return: Voir `parse_mcc_all`.
+    :rtype: Dict[str, object]
+    """
+    result = _load_parsed_cache(path_str, mtime_ns, size)
+    if result is None:
+        result = _parse_mcc_bytes(Path(path_str).read_bytes())
+        _save_parsed_cache(path_str, mtime_ns, size, result)
+    depths_mm = tuple(
+        float(d["depth_mm"]) for lst in result["profiles"].values() for d in lst if d["depth_mm"] is not None
+    )
+    result["file"] = ParsedFile(path_str, mtime_ns, result["meta"], depths_mm)
     return result
 
 
-def parse_mcc_pdd(filepath: Path | str) -> Tuple[Optional[List[float]], Optional[List[float]]]:
+def parse_mcc_all(filepath: Path | str) -> Dict[str, object]:
     """
-    Parser une acquisition PDD depuis un fichier MCC.
+    Parser un fichier MCC (métadonnées, PDD et profils) en une seule lecture.
+
+    Structure de retour :
+        {
+          "pdd": (xs, ys) | (None, None),
+          "profiles": {"inplane": [...], "crossplane": [...]},
+          "meta": {"CLE": "valeur", ...},
+          "file": ParsedFile | None
+        }
+
+    Le résultat est mis en cache par (chemin, mtime_ns, taille) : il est
+    partagé entre appels et ne doit pas être modifié en place.
 
     :param filepath: Chemin du fichier MCC.
     :type filepath: Path | str
-    :return: Tuple (xs, ys) ou (None, None) si échec / non trouvé.
-    :rtype: Tuple[Optional[List[float]], Optional[List[float]]]
+    :return: Dictionnaire {"pdd", "profiles", "meta", "file"}.
+    :rtype: Dict[str, object]
     """
     path = Path(filepath)
     try:
-        lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    except Exception as exc:  # pragma: no cover
+        st = path.stat()
+        # Un échec (ex. fichier verrouillé) n'est pas mémorisé : nouvel essai au prochain appel
+        return _parse_mcc_cached(str(path), st.st_mtime_ns, st.st_size)
+    except Exception as exc:  # pragma: no cover - robustesse I/O
         print(f"Erreur d'ouverture {path}: {exc}")
-        return None, None
-    try:
-        i0 = next(i for i, l in enumerate(lines) if "BEGIN_DATA" in l)
-        i1 = next(i for i, l in enumerate(lines) if "END_DATA" in l)
-    except StopIteration:
-        return None, None
-    xs: List[float] = []
-    ys: List[float] = []
-    for line in lines[i0 + 1:i1]:
-        parts = line.split()
-        if len(parts) >= 2:
-            try:
-                xs.append(float(parts[0]))
-                ys.append(float(parts[1]))
-            except ValueError:
-                pass
-    return (xs or None), (ys or None)
+        return _empty_parse_result()
+
+
+def parse_mcc_profiles_all(filepath: Path | str) -> Dict[str, List[Dict[str, object]]]:
+    """
+    Parser toutes les courbes profil d'un fichier MCC.
+
+    Structure de retour :
+        {
+          "inplane": [
+              {"depth_mm": float|None, "xs": np.ndarray, "ys": np.ndarray},
+              ...
+          ],
+          "crossplane": [
+              ...
+          ]
+        }
+
+    :param filepath: Chemin de fichier .mcc.
+    :type filepath: Path | str
+    :return: Dictionnaire par orientation (absent si aucune courbe de ce type).
+    :rtype: Dict[str, List[Dict[str, object]]]
+    """
+    return parse_mcc_all(filepath)["profiles"]
+
+
+def parse_mcc_pdd(filepath: Path | str) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Parser une acquisition PDD depuis un fichier MCC.
+
+    Le PDD est le premier bloc BEGIN_DATA/END_DATA du fichier ; ses bornes sont
+    relevées pendant la passe unique de `parse_mcc_all` (aucun re-parcours).
+
+    :param filepath: Chemin du fichier MCC.
+    :type filepath: Path | str
+    :return: Tuple (xs, ys) ou (None, None) si échec / non trouvé.
+    :rtype: Tuple[Optional[np.ndarray], Optional[np.ndarray]]
+    """
+    return parse_mcc_all(filepath)["pdd"]
 
 
 # ======================== Mapping métadonnées ================================
 
 
+# Clés MCC candidates par grandeur, testées dans l'ordre
+META_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "energy": ("ENERGY", "SCAN_ENERGY", "BEAM_ENERGY", "XRAY_ENERGY"),
+    "detector": ("DETECTOR_TYPE", "DETECTOR", "SENSOR_TYPE"),
+    "ssd": ("SSD", "SCAN_SSD", "SOURCE_SURFACE_DISTANCE", "DSP"),
+    "sid": ("SID", "SOURCE_IMAGE_DISTANCE", "SAD"),
+    "gantry": ("GANTRY", "GANTRY_ANGLE", "SCAN_GANTRY", "BEAM_ANGLE"),
+    "dose_rate": ("DOSE_RATE", "MU_PER_MIN", "DOSE_RATE_MU_MIN"),
+    "orientation": ("DETECTOR_ORIENTATION",),
+    "jaw_x": ("JAW_X", "FIELD_X", "COLL_X"),
+    "jaw_y": ("JAW_Y", "FIELD_Y", "COLL_Y"),
+    "field_inplane": ("FIELD_INPLANE",),
+    "field_crossplane": ("FIELD_CROSSPLANE",),
+    "field_defined": ("FIELD_DEFINED", "FIELD_REFERENCE", "FIELD_AT"),
+    "field_depth": ("FIELD_DEPTH",),
+    "integration": ("INTEGRATION", "DWELL", "DWELL_TIME", "MEAS_TIME", "SAMPLE_TIME"),
+}
+
+
 def _pick(meta: Dict[str, str], *keys: str) -> Optional[str]:
     """
     Retourner la première valeur non vide trouvée parmi `keys` dans `meta`.
@@ -411,11 +1011,26 @@ def _pick(meta: Dict[str, str], *keys: str) -> Optional[str]:
     :rtype: Optional[str]
     """
     for key in keys:
-        if key in meta and str(meta[key]).strip():
-            return meta[key]
+        value = meta.get(key)
+        if value and not value.isspace():
+            return value
     return None
 
 
+def _pick_by(meta: Dict[str, str], name: str) -> Optional[str]:
+    """
+    Retourner la première valeur non vide pour la grandeur `name` (cf. META_ALIASES).
+
+    :param meta: Métadonnées (clés en MAJUSCULES).
+    :type meta: Dict[str, str]
+    :param name: Nom de la grandeur (clé de META_ALIASES).
+    :type name: str
+    :return: Valeur correspondante ou None.
+    :rtype: Optional[str]
+    """
+    return _pick(meta, *META_ALIASES[name])
+
+
 def _energy_from(meta: Dict[str, str]) -> Optional[str]:
     """
     Déduire l'énergie (MV) et suffixer FFF si applicable.
@@ -430,15 +1045,19 @@ def _energy_from(meta: Dict[str, str]) -> Optional[str]:
     :return: Chaîne énergie (ex. '6 MV', '10 MV FFF') ou None si inconnue.
     :rtype: Optional[str]
     """
-    energy = _pick(meta, "ENERGY", "SCAN_ENERGY", "BEAM_ENERGY", "XRAY_ENERGY")
+    energy = _pick_by(meta, "energy")
     if not energy:
         return None
     e = str(energy).strip()
-    up_all = " ".join([f"{k}={v}" for k, v in meta.items()]).upper()
-    want_fff = ("FFF" in e.upper()) or ("FFF" in up_all) or (
-        "FLATTENING" in up_all and ("OFF" in up_all or "FREE" in up_all)
+    if "FFF" in e.upper():
+        return e
+    # Clés (déjà en MAJUSCULES) + valeurs mises en majuscules une seule fois ;
+    # les any() s'arrêtent au premier indicateur trouvé.
+    texts = tuple(meta) + tuple(str(v).upper() for v in meta.values())
+    want_fff = any("FFF" in t for t in texts) or (
+        any("FLATTENING" in t for t in texts) and any("OFF" in t or "FREE" in t for t in texts)
     )
-    if "FFF" not in e.upper() and want_fff:
+    if want_fff:
         e = f"{e} FFF"
     return e
 
@@ -452,14 +1071,26 @@ def _detector_from(meta: Dict[str, str]) -> Optional[str]:
     :return: Chaîne 'PTW xxxxx' ou None si non détectable.
     :rtype: Optional[str]
     """
-    raw = _pick(meta, "DETECTOR_TYPE", "DETECTOR", "SENSOR_TYPE")
+    raw = _pick_by(meta, "detector")
     if not raw:
         return None
-    match = re.search(r"\bT([A-Za-z0-9\-]+)\b", str(raw))
+    return _detector_ref(str(raw))
+
+
+@functools.lru_cache(maxsize=None)
+def _detector_ref(raw: str) -> Optional[str]:
+    """
+    Extraire 'PTW xxxxx' d'une chaîne DETECTOR_TYPE (résultat mis en cache).
+
+    :param raw: Valeur brute de DETECTOR_TYPE.
+    :type raw: str
+    :return: Chaîne 'PTW xxxxx' ou None si non détectable.
+    :rtype: Optional[str]
+    """
+    match = DETECTOR_RE.search(raw)
     if not match:
         return None
-    ref = match.group(1)
-    return f"PTW {ref}"
+    return f"PTW {match.group(1)}"
 
 
 def _ssd_cm_from_mm(meta: Dict[str, str]) -> Optional[float]:
@@ -471,7 +1102,7 @@ def _ssd_cm_from_mm(meta: Dict[str, str]) -> Optional[float]:
     :return: SSD en cm ou None.
     :rtype: Optional[float]
     """
-    value = _pick(meta, "SSD", "SCAN_SSD", "SOURCE_SURFACE_DISTANCE", "DSP")
+    value = _pick_by(meta, "ssd")
     val = _as_float(value)
     if val is None:
         return None
@@ -487,7 +1118,7 @@ def _sid_from(meta: Dict[str, str]) -> Optional[float]:
     :return: Distance en cm ou None.
     :rtype: Optional[float]
     """
-    value = _pick(meta, "SID", "SOURCE_IMAGE_DISTANCE", "SAD")
+    value = _pick_by(meta, "sid")
     return _as_float(value)
 
 
@@ -500,7 +1131,7 @@ def _gantry_from(meta: Dict[str, str]) -> Optional[float]:
     :return: Angle en degrés ou None.
     :rtype: Optional[float]
     """
-    value = _pick(meta, "GANTRY", "GANTRY_ANGLE", "SCAN_GANTRY", "BEAM_ANGLE")
+    value = _pick_by(meta, "gantry")
     return _as_float(value)
 
 
@@ -513,7 +1144,7 @@ def _dose_rate_from(meta: Dict[str, str]) -> Optional[str]:
     :return: Chaîne de débit de dose ou None.
     :rtype: Optional[str]
     """
-    return _pick(meta, "DOSE_RATE", "MU_PER_MIN", "DOSE_RATE_MU_MIN")
+    return _pick_by(meta, "dose_rate")
 
 
 def _orientation_from(meta: Dict[str, str]) -> Optional[str]:
@@ -525,7 +1156,7 @@ def _orientation_from(meta: Dict[str, str]) -> Optional[str]:
     :return: 'Radial', 'Axial' ou None.
     :rtype: Optional[str]
     """
-    orient = (_pick(meta, "DETECTOR_ORIENTATION") or "").strip().upper()
+    orient = (_pick_by(meta, "orientation") or "").strip().upper()
     if orient.startswith("HOR"):
         return "Radial"
     if orient.startswith("VER"):
@@ -533,38 +1164,50 @@ def _orientation_from(meta: Dict[str, str]) -> Optional[str]:
     return None
 
 
-def _jaws_from(meta: Dict[str, str],
-               depth_mm_for_guess: Optional[float]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+class _Geometry(NamedTuple):
     """
-    Déduire la taille de champ aux mâchoires (X,Y en cm) et le plan de référence.
+    Géométrie de champ extraite une fois des métadonnées.
+
+    `d_ref_cm` vaut None quand le plan de référence n'est pas défini
+    explicitement : il dépend alors de la profondeur du point (SSD + z).
+    """
+
+    ssd_cm: Optional[float]
+    jawx_cm: Optional[float]
+    jawy_cm: Optional[float]
+    d_ref_cm: Optional[float]
+
+
+def _precompute_geometry(meta: Dict[str, str]) -> _Geometry:
+    """
+    Extraire SSD, mâchoires (X,Y en cm) et plan de référence explicite.
 
     Sources possibles :
       - JAW_X/JAW_Y/FIELD_X/FIELD_Y/COLL_X/COLL_Y (déjà en cm)
       - FIELD_INPLANE/FIELD_CROSSPLANE (en mm) + FIELD_DEFINED (plan)
-    Le plan de référence (`d_ref_cm`) peut être l’isocentre (100 cm), SSD ou SSD+profondeur.
+    Le plan de référence peut être l’isocentre (100 cm), SSD ou SSD+profondeur
+    de référence ; sinon il est laissé à None (cf. `_Geometry`).
 
     :param meta: Métadonnées MCC.
     :type meta: Dict[str, str]
-    :param depth_mm_for_guess: Profondeur (mm) pour estimer le plan si ambigu.
-    :type depth_mm_for_guess: Optional[float]
-    :return: (jawx_cm, jawy_cm, d_ref_cm)
-    :rtype: Tuple[Optional[float], Optional[float], Optional[float]]
+    :return: Géométrie (ssd_cm, jawx_cm, jawy_cm, d_ref_cm).
+    :rtype: _Geometry
     """
-    jawx = _as_float(_pick(meta, "JAW_X", "FIELD_X", "COLL_X"))
-    jawy = _as_float(_pick(meta, "JAW_Y", "FIELD_Y", "COLL_Y"))
+    jawx = _as_float(_pick_by(meta, "jaw_x"))
+    jawy = _as_float(_pick_by(meta, "jaw_y"))
 
     if jawx is None or jawy is None:
-        rf_x_mm = _as_float(_pick(meta, "FIELD_INPLANE", "FIELD_INPLANE"))
-        rf_y_mm = _as_float(_pick(meta, "FIELD_CROSSPLANE", "FIELD_CROSSPLANE"))
+        rf_x_mm = _as_float(_pick_by(meta, "field_inplane"))
+        rf_y_mm = _as_float(_pick_by(meta, "field_crossplane"))
         if rf_x_mm is not None and rf_y_mm is not None:
             jawx = rf_x_mm / 10.0
             jawy = rf_y_mm / 10.0
 
     ssd_cm = _ssd_cm_from_mm(meta)
-    refdef = (_pick(meta, "FIELD_DEFINED", "FIELD_REFERENCE", "FIELD_AT") or "").strip().upper()
+    refdef = (_pick_by(meta, "field_defined") or "").strip().upper()
     d_ref: Optional[float] = None
 
-    ref_depth_cm = _as_float(_pick(meta, "FIELD_DEPTH"))
+    ref_depth_cm = _as_float(_pick_by(meta, "field_depth"))
     if ref_depth_cm is not None:
         ref_depth_cm /= 10.0
 
@@ -575,16 +1218,32 @@ def _jaws_from(meta: Dict[str, str],
     elif "DEPTH" in refdef and ssd_cm is not None and ref_depth_cm is not None:
         d_ref = ssd_cm + ref_depth_cm
 
-    if d_ref is None:
-        depth_cm_guess = None if depth_mm_for_guess is None else (depth_mm_for_guess / 10.0)
-        if ssd_cm is not None and depth_cm_guess is not None:
-            d_ref = ssd_cm + depth_cm_guess
-        elif ssd_cm is not None:
-            d_ref = ssd_cm
-        else:
-            d_ref = None
+    return _Geometry(ssd_cm, jawx, jawy, d_ref)
+
+
+def _jaws_from(meta: Dict[str, str],
+               depth_mm_for_guess: Optional[float]) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Déduire la taille de champ aux mâchoires (X,Y en cm) et le plan de référence.
 
-    return jawx, jawy, d_ref
+    Voir `_precompute_geometry` ; si le plan n'est pas défini explicitement,
+    il est estimé à SSD + `depth_mm_for_guess` (ou SSD seule).
+
+    :param meta: Métadonnées MCC.
+    :type meta: Dict[str, str]
+    :param depth_mm_for_guess: Profondeur (mm) pour estimer le plan si ambigu.
+    :type depth_mm_for_guess: Optional[float]
+    :return: (jawx_cm, jawy_cm, d_ref_cm)
+    :rtype: Tuple[Optional[float], Optional[float], Optional[float]]
+    """
+    geo = _precompute_geometry(meta)
+    d_ref = geo.d_ref_cm
+    if d_ref is None and geo.ssd_cm is not None:
+        if depth_mm_for_guess is not None:
+            d_ref = geo.ssd_cm + depth_mm_for_guess / 10.0
+        else:
+            d_ref = geo.ssd_cm
+    return geo.jawx_cm, geo.jawy_cm, d_ref
 
 
 def _scale_jaw_to_100(jaw_raw_cm: Optional[float], d_ref_cm: Optional[float]) -> Optional[float]:
@@ -618,6 +1277,33 @@ def _unique_depths_cm_from_mm(depths_mm: List[float]) -> List[float]:
     return sorted({round(mm / 10.0, 2) for mm in depths_mm if mm is not None})
 
 
+def _fov_pairs(meta: Dict[str, str], depths_cm: Sequence[float]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Calculer le FOV (X,Y) au point pour plusieurs profondeurs à la fois.
+
+    Les métadonnées ne sont lues qu'une fois (`_precompute_geometry`), puis
+    le calcul est vectorisé sur toutes les profondeurs.
+
+    :param meta: Métadonnées MCC.
+    :type meta: Dict[str, str]
+    :param depths_cm: Profondeurs en cm.
+    :type depths_cm: Sequence[float]
+    :return: Tableaux (fx, fy) en cm, ou None si indéterminable.
+    :rtype: Optional[Tuple[np.ndarray, np.ndarray]]
+    """
+    geo = _precompute_geometry(meta)
+    if geo.ssd_cm is None or geo.jawx_cm is None or geo.jawy_cm is None:
+        return None
+    z = np.asarray(depths_cm, dtype=np.float64)
+    dist = geo.ssd_cm + z
+    d_ref = dist if geo.d_ref_cm is None else np.full_like(z, geo.d_ref_cm)
+    # Mise à l'échelle au plan 100 cm (inchangé si le plan est indéterminable)
+    scale = np.divide(DEFAULT_SAD_CM, d_ref, out=np.ones_like(z), where=d_ref != 0)
+    fx = geo.jawx_cm * scale * dist / DEFAULT_SAD_CM
+    fy = geo.jawy_cm * scale * dist / DEFAULT_SAD_CM
+    return fx, fy
+
+
 def _fov_at_depth_pair(meta: Dict[str, str], depth_cm: float) -> Optional[Tuple[float, float]]:
     """
     Calculer le FOV (X,Y) au point en profondeur `depth_cm`.
@@ -629,17 +1315,11 @@ def _fov_at_depth_pair(meta: Dict[str, str], depth_cm: float) -> Optional[Tuple[
     :return: Tuple (fx, fy) en cm, ou None si indéterminable.
     :rtype: Optional[Tuple[float, float]]
     """
-    ssd_cm = _ssd_cm_from_mm(meta)
-    if ssd_cm is None:
+    pairs = _fov_pairs(meta, (depth_cm,))
+    if pairs is None:
         return None
-    jawx, jawy, d_ref = _jaws_from(meta, depth_mm_for_guess=depth_cm * 10.0)
-    jawx100 = _scale_jaw_to_100(jawx, d_ref)
-    jawy100 = _scale_jaw_to_100(jawy, d_ref)
-    if jawx100 is None or jawy100 is None:
-        return None
-    fx = jawx100 * (ssd_cm + depth_cm) / DEFAULT_SAD_CM
-    fy = jawy100 * (ssd_cm + depth_cm) / DEFAULT_SAD_CM
-    return fx, fy
+    fx, fy = pairs
+    return float(fx[0]), float(fy[0])
 
 
 def _fov_at_depth_str(meta: Dict[str, str], depth_cm: float) -> Optional[str]:
@@ -674,12 +1354,11 @@ def _fov_string_from(meta: Dict[str, str], depths_mm: List[float]) -> Optional[s
     depths_cm = _unique_depths_cm_from_mm(depths_mm)
     if not depths_cm:
         return None
-    parts = []
-    for z in depths_cm:
-        fov = _fov_at_depth_str(meta, z)
-        if fov:
-            parts.append(f"@{z:.1f} cm : {fov}")
-    return " ; ".join(parts) if parts else None
+    pairs = _fov_pairs(meta, depths_cm)
+    if pairs is None:
+        return None
+    parts = [f"@{z:.1f} cm : {fx:.2f}*{fy:.2f}" for z, fx, fy in zip(depths_cm, *pairs)]
+    return " ; ".join(parts)
 
 
 # ---- Pas / Mode (auto) ------------------------------------------------------
@@ -713,18 +1392,15 @@ def _step_from_positions_csv(csv_txt: Optional[str]) -> Optional[Tuple[float, fl
     """
     if not csv_txt:
         return None
-    xs = _parse_csv_floats(csv_txt)
-    if len(xs) < 2:
+    xs = _csv_to_array(str(csv_txt))
+    if xs.size < 2:
         return None
-    diffs = []
-    for a, b in zip(xs[:-1], xs[1:]):
-        d = abs(b - a)
-        if d > 1e-6:
-            diffs.append(d)
-    if not diffs:
+    diffs = np.abs(np.diff(xs))
+    diffs = diffs[diffs > 1e-6]
+    if diffs.size == 0:
         return None
-    dmin = min(diffs)
-    dmax = max(diffs)
+    dmin = float(diffs.min())
+    dmax = float(diffs.max())
     is_fixed = abs(dmax - dmin) <= 1e-3
     return dmin, dmax, is_fixed
 
@@ -804,7 +1480,7 @@ def map_meta_to_params(meta: Dict[str, str], depths_mm: List[float], measure_kin
     if gan is not None:
         out["gantry"] = f"{gan:g}"
 
-    integ = _as_float(_pick(meta, "INTEGRATION", "DWELL", "DWELL_TIME", "MEAS_TIME", "SAMPLE_TIME"))
+    integ = _as_float(_pick_by(meta, "integration"))
     if integ is not None:
         out["integration"] = f"{integ:g}"
 
@@ -836,6 +1512,23 @@ def map_meta_to_params(meta: Dict[str, str], depths_mm: List[float], measure_kin
     return out
 
 
+@functools.lru_cache(maxsize=256)
+def map_file_to_params(parsed: ParsedFile, measure_kind: str) -> Dict[str, str]:
+    """
+    Version mémoïsée de `map_meta_to_params` pour un fichier parsé.
+
+    Le dictionnaire retourné est partagé entre appels : ne pas le modifier.
+
+    :param parsed: Fichier parsé (cf. `parse_mcc_all(...)["file"]`).
+    :type parsed: ParsedFile
+    :param measure_kind: Type de mesure ('pdd' ou 'profil').
+    :type measure_kind: str
+    :return: Dictionnaire clé/valeur pour affichage.
+    :rtype: Dict[str, str]
+    """
+    return map_meta_to_params(parsed.meta, list(parsed.depths_mm), measure_kind)
+
+
 # ======================== Préférences ========================================
 
 
@@ -873,8 +1566,8 @@ def load_prefs() -> Dict[str, dict]:
     """
     if PREFS_PATH.exists():
         try:
-            with PREFS_PATH.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = PREFS_PATH.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             if not isinstance(data, dict):
                 return _default_prefs()
             data.setdefault(PREF_KEY_FILES, {})
@@ -897,7 +1590,7 @@ def load_prefs() -> Dict[str, dict]:
 
 def save_prefs(prefs: Dict[str, dict]) -> None:
     """
-    Sauvegarder les préférences vers PREFS_PATH (JSON).
+    Sauvegarder les préférences vers PREFS_PATH (JSON, via orjson si disponible).
 
     :param prefs: Dictionnaire de préférences à sauvegarder.
     :type prefs: Dict[str, dict]
@@ -905,6 +1598,9 @@ def save_prefs(prefs: Dict[str, dict]) -> None:
     :rtype: None
     """
     try:
+        if orjson is not None:
+            PREFS_PATH.write_bytes(orjson.dumps(prefs, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            return
         with PREFS_PATH.open("w", encoding="utf-8") as f:
             json.dump(prefs, f, ensure_ascii=False, indent=2)
     except Exception as exc:  # pragma: no cover - robustesse I/O
@@ -926,7 +1622,8 @@ class MCCPlotterGUI(tk.Tk):
       - l'export PNG.
 
     Les mappings couleur/marqueur sont mémorisés par paramètre (et pour FOV,
-    par profondeur via l'espace de noms 'fov@depth').
+    par profondeur via l'espace de noms 'fov@depth'), avec un cache de session
+    devant les préférences.
     """
 
     def __init__(self) -> None:
@@ -943,6 +1640,28 @@ class MCCPlotterGUI(tk.Tk):
 
         self.prefs: Dict[str, dict] = load_prefs()
         self.rows: List[Dict[str, object]] = []  # 1 entrée = 1 fichier
+        self._iid_to_index: Dict[str, int] = {}  # iid Treeview -> index dans self.rows
+        # Lignes pas encore insérées dans le Treeview (toujours en fin de self.rows)
+        self._rows_to_insert: deque = deque()
+        # (espace de noms, valeur brute) -> couleur / marqueur déjà attribués
+        self._color_cache: Dict[Tuple[str, str], str] = {}
+        self._marker_cache: Dict[Tuple[str, str], str] = {}
+        # Valeurs déjà attribuées par espace de noms (tenues à jour à chaque allocation)
+        self._used_colors: Dict[str, set] = {}
+        self._used_markers: Dict[str, set] = {}
+        # (id(ligne), profondeur cm) -> FOV 'X*Y', vidé à chaque tracé
+        self._fov_cache: Dict[Tuple[int, float], str] = {}
+        self._depth_str_cache: Dict[float, str] = {}  # profondeur cm -> texte '%g', idem
+        # Dernière figure Agg exportée et état qui l'a produite (réutilisée par l'export suivant)
+        self._export_figure: Optional[Tuple[tuple, Figure]] = None
+        self._var_change_after_id: Optional[str] = None
+        self._var_flush_marker_combo = False  # travaux différés par `_schedule_var_flush`
+        self._var_flush_depths = False
+        self._prefs_dirty = False  # préférences modifiées, écriture disque en attente
+        self._save_after_id: Optional[str] = None
+        self._plot_in_progress = False  # sauvegarde différée en fin de tracé
+        self._pending_refresh: set = set()  # iids dont la colonne 'Inclure' est à rafraîchir
+        self._refresh_after_id: Optional[str] = None
 
         # --- Haut : options ---
         top = ttk.Frame(self)
@@ -982,7 +1701,7 @@ class MCCPlotterGUI(tk.Tk):
         ttk.Combobox(
             top,
             textvariable=self.color_var_name,
-            values=[k for k, _ in PARAMS],
+            values=PARAM_KEYS,
             width=16,
             state="readonly",
         ).pack(side=tk.LEFT)
@@ -994,51 +1713,26 @@ class MCCPlotterGUI(tk.Tk):
         self.marker_combo = ttk.Combobox(
             top,
             textvariable=self.marker_var_name,
-            values=[""] + [k for k, _ in PARAMS if k != self.color_var_name.get()],
+            values=self._marker_choices(),
             width=16,
             state="readonly",
         )
         self.marker_combo.pack(side=tk.LEFT)
 
-        def _on_var_change(*_args) -> None:
-            """
-            Callback de modifications d'options haut de page : actualise préférences,
-            met à jour l'UI et recharge les profondeurs profil si besoin.
-
-            :return: None
-            :rtype: None
-            """
-            g = self.prefs[PREF_KEY_GLOBAL]
-            g[PREF_KEY_MEASURE_TYPE] = self.measure_type.get()
-            g[PREF_KEY_NORMALIZE] = bool(self.normalize_var.get())
-            g[PREF_KEY_PROFILE_INPLANE] = bool(self.profile_inplane_var.get())
-            g[PREF_KEY_PROFILE_CROSSPLANE] = bool(self.profile_crossplane_var.get())
-            g[PREF_KEY_CUSTOM_TITLE] = self.custom_title_var.get()
-            g[PREF_KEY_COLOR_VAR] = self.color_var_name.get()
-            sec = self.marker_var_name.get()
-            g[PREF_KEY_MARKER_VAR] = sec if sec and sec != g[PREF_KEY_COLOR_VAR] else ""
-            save_prefs(self.prefs)
-            self._update_profile_controls()
-            self.marker_combo.configure(values=[""] + [k for k, _ in PARAMS if k != self.color_var_name.get()])
-
-            if self.measure_type.get() == MEASURE_PROFILE:
-                self._ensure_profile_depths_loaded()
-
-        self.measure_type.trace_add("write", _on_var_change)
-        self.normalize_var.trace_add("write", _on_var_change)
-        self.profile_inplane_var.trace_add("write", _on_var_change)
-        self.profile_crossplane_var.trace_add("write", _on_var_change)
-        self.custom_title_var.trace_add("write", _on_var_change)
-        self.color_var_name.trace_add("write", _on_var_change)
-        self.marker_var_name.trace_add("write", _on_var_change)
+        self.measure_type.trace_add("write", self._on_measure_type_change)
+        self.normalize_var.trace_add("write", self._on_normalize_change)
+        self.profile_inplane_var.trace_add("write", self._on_profile_orient_change)
+        self.profile_crossplane_var.trace_add("write", self._on_profile_orient_change)
+        self.custom_title_var.trace_add("write", self._on_title_change)
+        self.color_var_name.trace_add("write", self._on_color_var_change)
+        self.marker_var_name.trace_add("write", self._on_marker_var_change)
 
         self._update_profile_controls()
 
         # --- Table ---
         mid = ttk.Frame(self)
         mid.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=(0, 8))
-        columns = ("include", "x_shift", "y_scale", "y_offset") + tuple(k for k, _ in PARAMS) + ("file",)
-        self.tree = ttk.Treeview(mid, columns=columns, show="headings", selectmode="extended")
+        self.tree = ttk.Treeview(mid, columns=TABLE_COLUMNS, show="headings", selectmode="extended")
 
         self.tree.heading("include", text="Inclure")
         self.tree.heading("x_shift", text="ΔX")
@@ -1051,7 +1745,7 @@ class MCCPlotterGUI(tk.Tk):
         self.tree.column("include", width=60, anchor=tk.CENTER)
         for col in ("x_shift", "y_scale", "y_offset"):
             self.tree.column(col, width=80, anchor=tk.E)
-        for key, _lbl in PARAMS:
+        for key in PARAM_KEYS:
             self.tree.column(key, width=180 if key in ("jaw_xy", "fov") else 130)
         self.tree.column("file", width=360)
 
@@ -1115,9 +1809,173 @@ class MCCPlotterGUI(tk.Tk):
         self.ctx_menu.add_separator()
         self.ctx_menu.add_command(label="Inverser", command=self.toggle_selected)
         self.tree.bind("<Button-3>", self._on_right_click)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # --------- Utilitaires GUI ---------
 
+    def _on_measure_type_change(self, *_args) -> None:
+        """
+        Type de mesure modifié : préférences, cases Inplane/Crossplane et, en
+        mode profil, rechargement différé des profondeurs.
+
+        :return: None
+        :rtype: None
+        """
+        self.prefs[PREF_KEY_GLOBAL][PREF_KEY_MEASURE_TYPE] = self.measure_type.get()
+        self._update_profile_controls()
+        self._schedule_var_flush(reload_depths=True)
+
+    def _on_normalize_change(self, *_args) -> None:
+        """
+        Option « Normaliser à 1 » modifiée.
+
+        :return: None
+        :rtype: None
+        """
+        self.prefs[PREF_KEY_GLOBAL][PREF_KEY_NORMALIZE] = bool(self.normalize_var.get())
+        self._schedule_var_flush()
+
+    def _on_profile_orient_change(self, *_args) -> None:
+        """
+        Cases Inplane/Crossplane modifiées.
+
+        :return: None
+        :rtype: None
+        """
+        g = self.prefs[PREF_KEY_GLOBAL]
+        g[PREF_KEY_PROFILE_INPLANE] = bool(self.profile_inplane_var.get())
+        g[PREF_KEY_PROFILE_CROSSPLANE] = bool(self.profile_crossplane_var.get())
+        self._schedule_var_flush()
+
+    def _on_title_change(self, *_args) -> None:
+        """
+        Titre personnalisé modifié (à chaque frappe : seule la préférence suit).
+
+        :return: None
+        :rtype: None
+        """
+        self.prefs[PREF_KEY_GLOBAL][PREF_KEY_CUSTOM_TITLE] = self.custom_title_var.get()
+        self._schedule_var_flush()
+
+    def _on_color_var_change(self, *_args) -> None:
+        """
+        Paramètre couleur modifié : le paramètre marqueur ne peut pas être le
+        même, et la liste des marqueurs proposés change.
+
+        :return: None
+        :rtype: None
+        """
+        self.prefs[PREF_KEY_GLOBAL][PREF_KEY_COLOR_VAR] = self.color_var_name.get()
+        self._on_marker_var_change()
+        self._schedule_var_flush(update_marker_combo=True)
+
+    def _on_marker_var_change(self, *_args) -> None:
+        """
+        Paramètre marqueur modifié (ignoré s'il est identique au paramètre couleur).
+
+        :return: None
+        :rtype: None
+        """
+        g = self.prefs[PREF_KEY_GLOBAL]
+        sec = self.marker_var_name.get()
+        g[PREF_KEY_MARKER_VAR] = sec if sec and sec != g[PREF_KEY_COLOR_VAR] else ""
+        self._schedule_var_flush()
+
+    def _schedule_var_flush(self, update_marker_combo: bool = False, reload_depths: bool = False) -> None:
+        """
+        Programmer (avec anti-rebond) la sauvegarde des options et les mises à
+        jour plus coûteuses de l'UI demandées par les callbacks.
+
+        :param update_marker_combo: Actualiser la liste des marqueurs proposés.
+        :type update_marker_combo: bool
+        :param reload_depths: Recharger les profondeurs profil (mode profil).
+        :type reload_depths: bool
+        :return: None
+        :rtype: None
+        """
+        self._var_flush_marker_combo |= update_marker_combo
+        self._var_flush_depths |= reload_depths
+        if self._var_change_after_id is not None:
+            self.after_cancel(self._var_change_after_id)
+        self._var_change_after_id = self.after(VAR_CHANGE_DEBOUNCE_MS, self._flush_var_change)
+
+    def _flush_var_change(self) -> None:
+        """
+        Sauvegarder les préférences et appliquer les mises à jour programmées
+        par `_schedule_var_flush` (fin de l'anti-rebond).
+
+        :return: None
+        :rtype: None
+        """
+        self._var_change_after_id = None
+        self._mark_prefs_dirty()
+        if self._var_flush_marker_combo:
+            self._var_flush_marker_combo = False
+            self.marker_combo.configure(values=self._marker_choices())
+        if self._var_flush_depths:
+            self._var_flush_depths = False
+            if self.measure_type.get() == MEASURE_PROFILE:
+                self._ensure_profile_depths_loaded()
+
+    def _on_close(self) -> None:
+        """
+        Fermer la fenêtre après avoir appliqué les modifications en attente
+        (options, préférences non encore écrites).
+
+        :return: None
+        :rtype: None
+        """
+        if self._var_change_after_id is not None:
+            self.after_cancel(self._var_change_after_id)
+            self._flush_var_change()
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._flush_prefs()
+        self.destroy()
+
+    def _mark_prefs_dirty(self) -> None:
+        """
+        Signaler une modification des préférences ; l'écriture disque est
+        regroupée en une seule sauvegarde au prochain cycle idle.
+
+        :return: None
+        :rtype: None
+        """
+        self._prefs_dirty = True
+        if self._plot_in_progress:
+            return  # une seule sauvegarde, programmée par `_plotting`
+        if self._save_after_id is None:
+            self._save_after_id = self.after_idle(self._flush_prefs)
+
+    @contextmanager
+    def _plotting(self) -> Iterator[None]:
+        """
+        Encadrer un tracé : les nouvelles couleurs/marqueurs attribués pendant
+        le tracé sont sauvegardés en une seule fois à la fin.
+
+        :return: Gestionnaire de contexte.
+        :rtype: Iterator[None]
+        """
+        self._plot_in_progress = True
+        try:
+            yield
+        finally:
+            self._plot_in_progress = False
+            if self._prefs_dirty:
+                self._mark_prefs_dirty()
+
+    def _flush_prefs(self) -> None:
+        """
+        Écrire les préférences sur disque si elles ont été modifiées.
+
+        :return: None
+        :rtype: None
+        """
+        self._save_after_id = None
+        if self._prefs_dirty:
+            self._prefs_dirty = False
+            save_prefs(self.prefs)
+
     def _update_profile_controls(self) -> None:
         """
         Activer/désactiver les cases Inplane/Crossplane selon le type de mesure.
@@ -1138,10 +1996,16 @@ class MCCPlotterGUI(tk.Tk):
         :return: Libellé (ex. 'Énergie [MV]').
         :rtype: str
         """
-        for k, lbl in PARAMS:
-            if k == key:
-                return lbl
-        return key
+        return PARAM_LABELS.get(key, key)
+
+    def _marker_choices(self) -> Tuple[str, ...]:
+        """
+        Valeurs proposées pour le paramètre secondaire (marqueur).
+
+        :return: Vide + clés de paramètres, hors paramètre couleur courant.
+        :rtype: Tuple[str, ...]
+        """
+        return MARKER_KEYS_MINUS.get(self.color_var_name.get(), ("",) + PARAM_KEYS)
 
     def _normalize_key(self, text: str) -> str:
         """
@@ -1154,14 +2018,14 @@ class MCCPlotterGUI(tk.Tk):
         """
         return str(text).strip().lower()
 
-    def _next_from_pool(self, used_set: set, pool: Iterable[str]) -> str:
+    def _next_from_pool(self, used_set: set, pool: Tuple[str, ...]) -> str:
         """
         Choisir le prochain élément disponible d'un pool (avec wrap).
 
-        :param used_set: Ensemble des valeurs déjà utilisées.
+        :param used_set: Ensemble des valeurs déjà utilisées (complété sur place).
         :type used_set: set
-        :param pool: Itérable de candidats.
-        :type pool: Iterable[str]
+        :param pool: Tuple de candidats.
+        :type pool: Tuple[str, ...]
         :return: Élément choisi.
         :rtype: str
         """
@@ -1169,8 +2033,7 @@ class MCCPlotterGUI(tk.Tk):
             if val not in used_set:
                 used_set.add(val)
                 return val
-        pool_list = list(pool)
-        return pool_list[(len(used_set)) % max(1, len(pool_list))]
+        return pool[len(used_set) % max(1, len(pool))]
 
     def _get_color_for(self, param_name: str, value: str) -> str:
         """
@@ -1183,18 +2046,24 @@ class MCCPlotterGUI(tk.Tk):
         :return: Code couleur hexadécimal.
         :rtype: str
         """
+        key = param_name or "default"
+        cached = self._color_cache.get((key, value))
+        if cached is not None:
+            return cached
         g = self.prefs[PREF_KEY_GLOBAL]
         maps: Dict[str, Dict[str, str]] = g.get(PREF_KEY_COLOR_MAPS, {})
-        key = param_name or "default"
         maps.setdefault(key, {})
         norm_val = self._normalize_key(value)
         param_map = maps[key]
         if norm_val not in param_map:
-            used = set(param_map.values())
+            used = self._used_colors.get(key)
+            if used is None:  # amorcé une seule fois depuis les préférences
+                used = self._used_colors[key] = set(param_map.values())
             param_map[norm_val] = self._next_from_pool(used, OKABE_ITO)
             g[PREF_KEY_COLOR_MAPS] = maps
-            save_prefs(self.prefs)
-        return param_map[norm_val]
+            self._mark_prefs_dirty()
+        color = self._color_cache[(key, value)] = param_map[norm_val]
+        return color
 
     def _get_marker_for(self, param_name: str, value: str) -> str:
         """
@@ -1209,17 +2078,23 @@ class MCCPlotterGUI(tk.Tk):
         """
         if not param_name:
             return "o"
+        cached = self._marker_cache.get((param_name, value))
+        if cached is not None:
+            return cached
         g = self.prefs[PREF_KEY_GLOBAL]
         maps: Dict[str, Dict[str, str]] = g.get(PREF_KEY_MARKER_MAPS, {})
         maps.setdefault(param_name, {})
         norm_val = self._normalize_key(value)
         param_map = maps[param_name]
         if norm_val not in param_map:
-            used = set(param_map.values())
+            used = self._used_markers.get(param_name)
+            if used is None:  # amorcé une seule fois depuis les préférences
+                used = self._used_markers[param_name] = set(param_map.values())
             param_map[norm_val] = self._next_from_pool(used, MARKER_POOL)
             g[PREF_KEY_MARKER_MAPS] = maps
-            save_prefs(self.prefs)
-        return param_map[norm_val]
+            self._mark_prefs_dirty()
+        marker = self._marker_cache[(param_name, value)] = param_map[norm_val]
+        return marker
 
     # --------- Persistance per-file (clé = chemin absolu) ---------
 
@@ -1227,12 +2102,15 @@ class MCCPlotterGUI(tk.Tk):
         """
         Obtenir une clé unique pour un fichier (chemin absolu résolu).
 
+        La clé est mémorisée à l'ajout du fichier ('_file_key') : pas de
+        `resolve()` (accès disque) lors des opérations en lot.
+
         :param item: Dictionnaire de ligne (contient 'path').
         :type item: Dict[str, object]
         :return: Clé de fichier.
         :rtype: str
         """
-        return str(Path(str(item.get("path", ""))).resolve())
+        return str(item.get("_file_key") or Path(str(item.get("path", ""))).resolve())
 
     def _load_file_block(self, file_key: str) -> Optional[dict]:
         """
@@ -1245,7 +2123,7 @@ class MCCPlotterGUI(tk.Tk):
         """
         return self.prefs.get(PREF_KEY_FILES, {}).get(file_key)
 
-    def _save_file_block(self, file_key: str, content: Dict[str, object]) -> None:
+    def _save_file_block(self, file_key: str, content: Dict[str, object]) -> bool:
         """
         Sauvegarder le bloc de préférences pour un fichier.
 
@@ -1253,8 +2131,8 @@ class MCCPlotterGUI(tk.Tk):
         :type file_key: str
         :param content: Valeurs à persister (x_shift, y_scale, etc.).
         :type content: Dict[str, object]
-        :return: None
-        :rtype: None
+        :return: True si le bloc a changé (écriture disque nécessaire).
+        :rtype: bool
         """
         block = {
             "x_shift": content["x_shift"],
@@ -1263,9 +2141,29 @@ class MCCPlotterGUI(tk.Tk):
             "include": bool(content["include"]),
             "linestyle": content.get("linestyle", DEFAULT_LINESTYLE),
         }
-        for key, _ in PARAMS:
+        for key in PARAM_KEYS:
             block[key] = content.get(key, "")
-        self.prefs.setdefault(PREF_KEY_FILES, {})[file_key] = block
+        files = self.prefs.setdefault(PREF_KEY_FILES, {})
+        if files.get(file_key) == block:
+            return False
+        files[file_key] = block
+        return True
+
+    def _save_file_blocks(self, rows: Iterable[Dict[str, object]]) -> None:
+        """
+        Sauvegarder les blocs de préférences de plusieurs lignes, puis
+        programmer une unique écriture disque (si un bloc a changé).
+
+        :param rows: Lignes à persister.
+        :type rows: Iterable[Dict[str, object]]
+        :return: None
+        :rtype: None
+        """
+        changed = False
+        for row in rows:
+            changed |= self._save_file_block(self._file_key(row), row)
+        if changed:
+            self._mark_prefs_dirty()
 
     # --------- Table ---------
 
@@ -1275,7 +2173,7 @@ class MCCPlotterGUI(tk.Tk):
 
         Lecture :
           1) Charge préférences JSON par fichier (si existantes),
-          2) Parse MCC pour métadonnées / profils / PDD,
+          2) Parse MCC pour métadonnées / profils / PDD (fichiers en parallèle),
           3) Auto-remplit colonnes UI si champs vides,
           4) Insère dans le Treeview.
 
@@ -1286,10 +2184,17 @@ class MCCPlotterGUI(tk.Tk):
         if not paths:
             return
 
-        for pth in paths:
-            abspath = str(Path(pth).resolve())
+        # Parsing en parallèle (lecture disque + NumPy), insertion ensuite dans
+        # le thread Tk ; chaque chemin distinct n'est parsé qu'une fois
+        abspaths = [str(Path(pth).resolve()) for pth in paths]
+        parsed_by_path = self._parse_files_parallel(list(dict.fromkeys(abspaths)))
+
+        new_items: List[Dict[str, object]] = []
+        for abspath in abspaths:
             item: Dict[str, object] = {
                 "path": abspath,
+                "_file_key": abspath,  # chemin déjà résolu
+                "_display_name": Path(abspath).name,
                 "x_shift": 0.0,
                 "y_scale": 1.0,
                 "y_offset": 0.0,
@@ -1299,8 +2204,10 @@ class MCCPlotterGUI(tk.Tk):
                 "_profiles": None,
                 "_pdd": None,
                 "_meta": {},
+                "_file": None,
+                "_profile_depths_cached": False,  # cf. _ensure_profile_depths_loaded
             }
-            for key, _ in PARAMS:
+            for key in PARAM_KEYS:
                 item[key] = ""
 
             # 1) Charger le JSON (prioritaire pour les champs textes)
@@ -1311,46 +2218,82 @@ class MCCPlotterGUI(tk.Tk):
                 item["y_offset"] = float(saved.get("y_offset", item["y_offset"]))
                 item["include"] = bool(saved.get("include", item["include"]))
                 item["linestyle"] = saved.get("linestyle", item["linestyle"])
-                for key, _ in PARAMS:
+                for key in PARAM_KEYS:
                     if key in saved and str(saved[key]).strip():
                         item[key] = saved[key]
 
-            # 2) Lire Meta + Profils + PDD (indépendant du JSON)
-            try:
-                lines = Path(abspath).read_text(encoding="utf-8", errors="ignore").splitlines()
-                meta = _scan_keyvals(lines)
-            except Exception:
-                meta = {}
-
-            profiles = parse_mcc_profiles_all(abspath)
+            # 2) Meta + Profils + PDD lus en une passe (indépendant du JSON)
+            parsed = parsed_by_path[abspath]
+            meta = parsed["meta"]
+            profiles = parsed["profiles"]
             item["_profiles"] = profiles
             item["_meta"] = meta
+            item["_file"] = parsed["file"]
+            item["_depths_mm"] = parsed["file"].depths_mm if parsed["file"] else ()
 
-            xs_pdd, ys_pdd = parse_mcc_pdd(abspath)
+            xs_pdd, ys_pdd = parsed["pdd"]
             if xs_pdd is not None and ys_pdd is not None:
                 item["_pdd"] = (xs_pdd, ys_pdd)
 
-            # 3) Profondeurs détectées (union In+Cross)
-            depths_mm_all: List[float] = []
-            for lst in profiles.values():
-                for d in lst:
-                    if d.get("depth_mm") is not None:
-                        depths_mm_all.append(float(d["depth_mm"]))
-
-            # 4) Auto-remplissage des champs vides (priorité JSON)
-            auto = map_meta_to_params(meta, depths_mm_all, self.measure_type.get())
-            for key, _ in PARAMS:
+            # 3-4) Auto-remplissage des champs vides (priorité JSON), à partir
+            # des profondeurs détectées (union In+Cross) ; mémoïsé par fichier
+            auto = map_file_to_params(parsed["file"], self.measure_type.get()) if parsed["file"] else {}
+            for key in PARAM_KEYS:
                 if (not str(item.get(key, "")).strip()) and (key in auto):
                     item[key] = auto[key]
 
-            # 5) Affichage
-            include_txt = SYMBOL_INCLUDE if item["include"] else SYMBOL_EXCLUDE
-            display_name = Path(abspath).name
-            values = [include_txt, item["x_shift"], item["y_scale"], item["y_offset"]]
-            values += [item[key] for key, _ in PARAMS] + [display_name]
-            iid = self.tree.insert("", tk.END, values=tuple(values))
-            item["iid"] = iid
-            self.rows.append(item)
+            new_items.append(item)
+
+        # 5) Affichage : insertion par paquets (les grosses listes restent réactives)
+        self.rows.extend(new_items)
+        self._rows_to_insert.extend(new_items)
+        self._insert_pending_rows()
+
+    def _insert_pending_rows(self) -> None:
+        """
+        Insérer dans le Treeview un paquet de TREE_INSERT_CHUNK lignes en
+        attente, puis reprogrammer la suite au prochain cycle idle.
+
+        :return: None
+        :rtype: None
+        """
+        queue = self._rows_to_insert
+        # Les lignes en attente sont toujours les dernières de self.rows
+        index = len(self.rows) - len(queue)
+        batch = min(TREE_INSERT_CHUNK, len(queue))
+        with self._tree_frozen(batch):
+            for _ in range(batch):
+                item = queue.popleft()
+                iid = self.tree.insert("", tk.END, values=self._row_values(item))
+                item["iid"] = iid
+                self._iid_to_index[iid] = index
+                index += 1
+        if queue:
+            self.after_idle(self._insert_pending_rows)
+
+    def _parse_files_parallel(self, paths: List[str]) -> Dict[str, Dict[str, object]]:
+        """
+        Parser plusieurs fichiers MCC en parallèle, avec progression dans le
+        titre de la fenêtre (curseur d'attente pendant le chargement).
+
+        :param paths: Chemins absolus distincts.
+        :type paths: List[str]
+        :return: Résultats de `parse_mcc_all` par chemin.
+        :rtype: Dict[str, Dict[str, object]]
+        """
+        results: Dict[str, Dict[str, object]] = {}
+        self.configure(cursor="watch")
+        try:
+            with ThreadPoolExecutor(max_workers=min(PARSE_WORKERS, len(paths))) as pool:
+                futures = {pool.submit(parse_mcc_all, path): path for path in paths}
+                for done, future in enumerate(as_completed(futures), start=1):
+                    results[futures[future]] = future.result()
+                    self.title(f"{APP_TITLE} – chargement {done}/{len(paths)}")
+                    self.update_idletasks()
+        finally:
+            self.title(APP_TITLE)
+            self.configure(cursor="")
+        return results
 
     def get_selected_index(self) -> Optional[int]:
         """
@@ -1362,11 +2305,7 @@ class MCCPlotterGUI(tk.Tk):
         sel = self.tree.selection()
         if not sel:
             return None
-        iid = sel[0]
-        for i, row in enumerate(self.rows):
-            if row.get("iid") == iid:
-                return i
-        return None
+        return self._iid_to_index.get(sel[0])
 
     def _selected_indices(self) -> List[int]:
         """
@@ -1375,14 +2314,8 @@ class MCCPlotterGUI(tk.Tk):
         :return: Liste d'indices.
         :rtype: List[int]
         """
-        ids = self.tree.selection()
-        out: List[int] = []
-        for iid in ids:
-            for i, row in enumerate(self.rows):
-                if row.get("iid") == iid:
-                    out.append(i)
-                    break
-        return out
+        lookup = self._iid_to_index
+        return [lookup[iid] for iid in self.tree.selection() if iid in lookup]
 
     def on_select_row(self, _event: Optional[tk.Event] = None) -> None:
         """
@@ -1401,9 +2334,44 @@ class MCCPlotterGUI(tk.Tk):
         self.y_scale_var.set(str(row["y_scale"]))
         self.y_offset_var.set(str(row["y_offset"]))
         self.include_var.set(bool(row["include"]))
-        for key, _ in PARAMS:
+        for key in PARAM_KEYS:
             self.param_vars[key].set(str(row.get(key, "")))
 
+    @contextmanager
+    def _tree_frozen(self, count: int) -> Iterator[None]:
+        """
+        Masquer les colonnes du Treeview pendant une mise à jour en lot, pour
+        un seul recalcul de l'affichage à la sortie. Sans effet pour moins de
+        TREE_FREEZE_MIN_ROWS lignes (le relayout complet coûterait plus cher).
+
+        :param count: Nombre de lignes touchées par la mise à jour.
+        :type count: int
+        :return: Gestionnaire de contexte.
+        :rtype: Iterator[None]
+        """
+        if count < TREE_FREEZE_MIN_ROWS:
+            yield
+            return
+        displayed = self.tree.cget("displaycolumns")
+        self.tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            self.tree.configure(displaycolumns=displayed)
+
+    def _row_values(self, row: Dict[str, object]) -> Tuple[object, ...]:
+        """
+        Construire en une passe les valeurs d'une ligne du Treeview (ordre TABLE_COLUMNS).
+
+        :param row: Ligne de données.
+        :type row: Dict[str, object]
+        :return: Valeurs des colonnes.
+        :rtype: Tuple[object, ...]
+        """
+        include_txt = SYMBOL_INCLUDE if row["include"] else SYMBOL_EXCLUDE
+        return (include_txt, row["x_shift"], row["y_scale"], row["y_offset"],
+                *map(row.__getitem__, PARAM_KEYS), row.get("_display_name") or Path(str(row["path"])).name)
+
     def _refresh_row(self, idx: int) -> None:
         """
         Rafraîchir l'affichage d'une ligne après modification.
@@ -1414,12 +2382,56 @@ class MCCPlotterGUI(tk.Tk):
         :rtype: None
         """
         row = self.rows[idx]
-        include_txt = SYMBOL_INCLUDE if row["include"] else SYMBOL_EXCLUDE
-        display_name = Path(str(row["path"])).name
-        values = [include_txt, row["x_shift"], row["y_scale"], row["y_offset"]]
-        values += [row[key] for key, _ in PARAMS] + [display_name]
         if row.get("iid"):
-            self.tree.item(row["iid"], values=tuple(values))
+            self.tree.item(row["iid"], values=self._row_values(row))
+
+    def _refresh_include_cell(self, idx: int) -> None:
+        """
+        Rafraîchir uniquement la colonne 'Inclure' d'une ligne.
+
+        :param idx: Index de la ligne.
+        :type idx: int
+        :return: None
+        :rtype: None
+        """
+        row = self.rows[idx]
+        if row.get("iid"):
+            self.tree.set(row["iid"], "include", SYMBOL_INCLUDE if row["include"] else SYMBOL_EXCLUDE)
+
+    def _schedule_include_refresh(self, idx: int) -> None:
+        """
+        Programmer le rafraîchissement de la colonne 'Inclure' d'une ligne au
+        prochain cycle idle.
+
+        Les bascules rapides (tout cocher, inverser…) sont ainsi regroupées en
+        une seule mise à jour par ligne.
+
+        :param idx: Index de la ligne.
+        :type idx: int
+        :return: None
+        :rtype: None
+        """
+        iid = self.rows[idx].get("iid")
+        if not iid:
+            return
+        self._pending_refresh.add(iid)
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.after_idle(self._flush_include_refresh)
+
+    def _flush_include_refresh(self) -> None:
+        """
+        Rafraîchir en une passe les lignes programmées par `_schedule_include_refresh`.
+
+        :return: None
+        :rtype: None
+        """
+        self._refresh_after_id = None
+        pending, self._pending_refresh = self._pending_refresh, set()
+        with self._tree_frozen(len(pending)):
+            for iid in pending:
+                idx = self._iid_to_index.get(iid)
+                if idx is not None:
+                    self._refresh_include_cell(idx)
 
     def apply_edit(self) -> None:
         """
@@ -1449,14 +2461,14 @@ class MCCPlotterGUI(tk.Tk):
         row["y_scale"] = y_scale
         row["y_offset"] = y_offset
         row["include"] = bool(self.include_var.get())
-        for key, _ in PARAMS:
+        for key in PARAM_KEYS:
             row[key] = self.param_vars[key].get().strip()
 
         # Si 'depth' a été modifié manuellement, recalcul FOV agrégé pour l’UI
         try:
             depth_csv = row.get("depth", "")
             manual_depths_mm: List[float] = []
-            for part in str(depth_csv).replace(";", ",").split(","):
+            for part in _DEPTH_SEP_RE.split(str(depth_csv)):
                 val = _as_float(part)
                 if val is not None:
                     manual_depths_mm.append(val * 10.0)  # cm -> mm
@@ -1469,8 +2481,8 @@ class MCCPlotterGUI(tk.Tk):
 
         self._refresh_row(idx)
         file_key = self._file_key(row)
-        self._save_file_block(file_key, row)
-        save_prefs(self.prefs)
+        if self._save_file_block(file_key, row):
+            self._mark_prefs_dirty()
 
     def remove_selected(self) -> None:
         """
@@ -1490,6 +2502,7 @@ class MCCPlotterGUI(tk.Tk):
                 except Exception:
                     pass
             del self.rows[idx]
+        self._iid_to_index = {row["iid"]: i for i, row in enumerate(self.rows) if row.get("iid")}
 
     def clear_all(self) -> None:
         """
@@ -1499,8 +2512,9 @@ class MCCPlotterGUI(tk.Tk):
         :rtype: None
         """
         self.rows.clear()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._rows_to_insert.clear()
+        self._iid_to_index.clear()
+        self.tree.delete(*self.tree.get_children())
 
     def _set_include_for_indices(self, indices: Iterable[int], value: bool) -> None:
         """
@@ -1513,13 +2527,11 @@ class MCCPlotterGUI(tk.Tk):
         :return: None
         :rtype: None
         """
+        indices = list(indices)
         for idx in indices:
-            row = self.rows[idx]
-            row["include"] = value
-            self._refresh_row(idx)
-            file_key = self._file_key(row)
-            self._save_file_block(file_key, row)
-        save_prefs(self.prefs)
+            self.rows[idx]["include"] = value
+            self._schedule_include_refresh(idx)
+        self._save_file_blocks(self.rows[idx] for idx in indices)
 
     def toggle_selected(self, *_args) -> None:
         """
@@ -1569,10 +2581,8 @@ class MCCPlotterGUI(tk.Tk):
         """
         for idx in range(len(self.rows)):
             self.rows[idx]["include"] = not bool(self.rows[idx]["include"])
-            self._refresh_row(idx)
-            file_key = self._file_key(self.rows[idx])
-            self._save_file_block(file_key, self.rows[idx])
-        save_prefs(self.prefs)
+            self._schedule_include_refresh(idx)
+        self._save_file_blocks(self.rows)
 
     def _on_right_click(self, event: tk.Event) -> None:
         """
@@ -1598,44 +2608,45 @@ class MCCPlotterGUI(tk.Tk):
         S'assurer que la colonne 'depth' est renseignée à partir des profils
         quand le mode 'Profil' est activé (si vide), et recalculer FOV agrégé.
 
+        Les lignes déjà traitées ('_profile_depths_cached') dont la cellule
+        'depth' est remplie sont ignorées ; un fichier n'est jamais re-parsé.
+
         :return: None
         :rtype: None
         """
-        changed = False
+        changed_rows: List[Dict[str, object]] = []
         for i, row in enumerate(self.rows):
-            need_profiles = not bool(row.get("_profiles"))
             need_depth_cell = not str(row.get("depth", "")).strip()
+            if row.get("_profile_depths_cached") and not need_depth_cell:
+                continue
+            need_profiles = not row.get("_profiles") and not row.get("_profile_depths_cached")
 
             if need_profiles:
                 try:
-                    profiles = parse_mcc_profiles_all(str(row["path"]))
+                    parsed = parse_mcc_all(str(row["path"]))
                 except Exception:
-                    profiles = {}
-                row["_profiles"] = profiles
+                    parsed = _empty_parse_result()
+                row["_profiles"] = parsed["profiles"]
+                row["_file"] = parsed["file"]
+                row["_depths_mm"] = parsed["file"].depths_mm if parsed["file"] else ()
+                row.pop("_depths_cache", None)
+            row["_profile_depths_cached"] = True
 
             profiles = row.get("_profiles") or {}
-            if profiles and need_depth_cell:
-                depths_mm_all: List[float] = []
-                for lst in profiles.values():
-                    for d in lst:
-                        dm = d.get("depth_mm")
-                        if dm is not None:
-                            depths_mm_all.append(float(dm))
-                if depths_mm_all:
-                    uniq_cm = sorted({round(mm / 10.0, 2) for mm in depths_mm_all})
-                    row["depth"] = ", ".join(f"{v:.1f}" for v in uniq_cm)
-
-                    meta = row.get("_meta") or {}
-                    fov_txt = _fov_string_from(meta, depths_mm_all)
-                    if fov_txt:
-                        row["fov"] = fov_txt
+            parsed_file = row.get("_file")
+            if profiles and need_depth_cell and parsed_file:
+                # Mêmes règles que l'auto-remplissage (profondeurs uniques + FOV)
+                auto = map_file_to_params(parsed_file, MEASURE_PROFILE)
+                if "depth" in auto:
+                    row["depth"] = auto["depth"]
+                    if "fov" in auto:
+                        row["fov"] = auto["fov"]
 
                     self._refresh_row(i)
-                    self._save_file_block(self._file_key(row), row)
-                    changed = True
+                    changed_rows.append(row)
 
-        if changed:
-            save_prefs(self.prefs)
+        if changed_rows:
+            self._save_file_blocks(changed_rows)
 
     # --------- Légende / styles / tracé ---------
 
@@ -1664,40 +2675,46 @@ class MCCPlotterGUI(tk.Tk):
         info = f" – Var: {self._param_label(color_param)}" if color_param else ""
         return f"{prefix}{info}" + (f" – {custom}" if custom else "")
 
-    def _apply_plot_labels(self) -> None:
+    def _apply_plot_labels(self, ax: plt.Axes) -> None:
         """
         Appliquer les labels d'axes et le titre, serrer la mise en page.
 
+        :param ax: Axes cible.
+        :type ax: plt.Axes
         :return: None
         :rtype: None
         """
         if self.measure_type.get() == MEASURE_PROFILE:
-            plt.xlabel("Position latérale (cm)")
+            ax.set_xlabel("Position latérale (cm)")
         else:
-            plt.xlabel("Profondeur (cm)")
+            ax.set_xlabel("Profondeur (cm)")
         ylabel = "Dose normalisée" if self.normalize_var.get() else "Charge [nC]"
-        plt.ylabel(ylabel)
-        plt.title(self._compose_title())
-        plt.tight_layout()
+        ax.set_ylabel(ylabel)
+        ax.set_title(self._compose_title())
+        ax.figure.tight_layout()
 
-    def _transform_xy(self, xs: List[float], ys: List[float], row: Dict[str, object]) -> Tuple[List[float], List[float]]:
+    def _transform_xy(self, xs: Sequence[float], ys: Sequence[float],
+                      row: Dict[str, object]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Appliquer ΔX, échelle Y, offset Y, et normalisation éventuelle.
+        Appliquer ΔX, échelle Y, offset Y, et normalisation éventuelle (vectorisé).
 
-        :param xs: Abscisses brutes.
-        :type xs: List[float]
-        :param ys: Ordonnées brutes.
-        :type ys: List[float]
+        :param xs: Abscisses brutes (tableau NumPy ou séquence).
+        :type xs: Sequence[float]
+        :param ys: Ordonnées brutes (tableau NumPy ou séquence).
+        :type ys: Sequence[float]
         :param row: Dictionnaire de la ligne (contient x_shift/y_scale/y_offset).
         :type row: Dict[str, object]
         :return: (xs_transformés, ys_transformés)
-        :rtype: Tuple[List[float], List[float]]
+        :rtype: Tuple[np.ndarray, np.ndarray]
         """
         x_shift = float(row["x_shift"])
         y_scale = float(row["y_scale"])
         y_offset = float(row["y_offset"])
-        xs_t = [x + x_shift for x in xs]
-        ys_t = [(y + y_offset) * y_scale for y in ys]
+        xs_t = np.asarray(xs, dtype=np.float64) + x_shift
+        ys_arr = np.asarray(ys)
+        if ys_arr.dtype != PROFILE_Y_DTYPE:
+            ys_arr = ys_arr.astype(np.float64, copy=False)
+        ys_t = (ys_arr + y_offset) * y_scale  # reste en float32 pour les profils
         if self.normalize_var.get():
             ys_t = normalize(ys_t)
         return xs_t, ys_t
@@ -1706,7 +2723,8 @@ class MCCPlotterGUI(tk.Tk):
                     row: Dict[str, object],
                     base_label_value: str,
                     depth_cm: Optional[float],
-                    suffix: str = "") -> str:
+                    suffix: str = "",
+                    color_var: Optional[str] = None) -> str:
         """
         Construire un libellé de légende à partir de la valeur de base + profondeur.
 
@@ -1718,16 +2736,34 @@ class MCCPlotterGUI(tk.Tk):
         :type depth_cm: Optional[float]
         :param suffix: Suffixe ('Inplane' / 'Crossplane') si orientations distinctes.
         :type suffix: str
+        :param color_var: Paramètre variable déjà lu (sinon lu depuis l'UI).
+        :type color_var: Optional[str]
         :return: Libellé prêt pour la légende.
         :rtype: str
         """
         label = base_label_value if base_label_value else "(valeur manquante)"
-        if self.color_var_name.get().strip() != "depth" and depth_cm is not None and self.color_var_name.get().strip() != "fov":
-            label = f"{label} – {depth_cm:g} cm"
+        if color_var is None:
+            color_var = self.color_var_name.get().strip()
+        if color_var not in ("depth", "fov") and depth_cm is not None:
+            label = f"{label} – {self._depth_str(depth_cm)} cm"
         if suffix:
             label = f"{label} – {suffix}"
         return label
 
+    def _depth_str(self, depth_cm: float) -> str:
+        """
+        Texte d'une profondeur (format '%g'), mémorisé le temps d'un tracé.
+
+        :param depth_cm: Profondeur cm.
+        :type depth_cm: float
+        :return: Profondeur formatée (ex. '10', '1.5').
+        :rtype: str
+        """
+        text = self._depth_str_cache.get(depth_cm)
+        if text is None:
+            text = self._depth_str_cache[depth_cm] = format(depth_cm, "g")
+        return text
+
     def _fov_value_at_depth(self, row: Dict[str, object], depth_cm: float) -> str:
         """
         Obtenir le FOV (X*Y) pour une ligne/fichier à la profondeur spécifiée.
@@ -1735,6 +2771,24 @@ class MCCPlotterGUI(tk.Tk):
         Essaye d'abord un calcul direct via métadonnées, sinon tente d'extraire
         depuis la chaîne agrégée 'fov' de la ligne.
 
+        :param row: Ligne de données (contient '_meta', 'fov').
+        :type row: Dict[str, object]
+        :param depth_cm: Profondeur cm.
+        :type depth_cm: float
+        :return: 'X*Y' ou '(FOV inconnu)'.
+        :rtype: str
+        """
+        key = (id(row), round(depth_cm, 3))
+        text = self._fov_cache.get(key)
+        if text is None:
+            text = self._fov_cache[key] = self._compute_fov_at_depth(row, depth_cm)
+        return text
+
+    @staticmethod
+    def _compute_fov_at_depth(row: Dict[str, object], depth_cm: float) -> str:
+        """
+        Calcul non mis en cache de `_fov_value_at_depth`.
+
         :param row: Ligne de données (contient '_meta', 'fov').
         :type row: Dict[str, object]
         :param depth_cm: Profondeur cm.
@@ -1747,15 +2801,16 @@ class MCCPlotterGUI(tk.Tk):
         if text:
             return text
 
-        agg = str(row.get("fov", ""))
-        try:
-            match = re.search(rf"@{depth_cm:.1f}\s*cm\s*:\s*([0-9.,]+)\*([0-9.,]+)", agg)
-            if match:
-                x_val = match.group(1).replace(",", ".")
-                y_val = match.group(2).replace(",", ".")
-                return f"{float(x_val):.2f}*{float(y_val):.2f}"
-        except Exception:
-            pass
+        target = f"{depth_cm:.1f}"
+        for match in FOV_ENTRY_RE.finditer(str(row.get("fov", ""))):
+            if match.group(1) != target:
+                continue
+            try:
+                x_val = float(match.group(2).replace(",", "."))
+                y_val = float(match.group(3).replace(",", "."))
+            except ValueError:
+                break
+            return f"{x_val:.2f}*{y_val:.2f}"
 
         return "(FOV inconnu)"
 
@@ -1763,23 +2818,31 @@ class MCCPlotterGUI(tk.Tk):
         """
         Lister toutes les profondeurs (cm) présentes dans les profils du fichier.
 
-        :param row: Ligne contenant '_profiles'.
+        Utilise les profondeurs relevées au parsing ('_depths_mm') ; à défaut,
+        parcourt les profils. Le résultat est mémorisé dans '_depths_cache'
+        tant que la source ('_depths_mm' ou '_profiles') n'est pas remplacée.
+
+        :param row: Ligne contenant '_depths_mm' ou '_profiles'.
         :type row: Dict[str, object]
         :return: Profondeurs uniques (cm) triées.
         :rtype: List[float]
         """
-        profiles = row.get("_profiles") or {}
-        depths: List[float] = []
-        for lst in profiles.values():
-            for d in lst:
-                dm = d.get("depth_mm")
-                if dm is not None:
-                    depths.append(round(float(dm) / 10.0, 3))
-        return sorted({round(v, 2) for v in depths})
+        depths_mm = row.get("_depths_mm")
+        source = depths_mm if depths_mm is not None else row.get("_profiles")
+        cached = row.get("_depths_cache")
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        if depths_mm is None:
+            profiles = source or {}
+            depths_mm = [d["depth_mm"] for lst in profiles.values() for d in lst if d.get("depth_mm") is not None]
+        depths_cm = sorted({round(float(dm) / 10.0, 2) for dm in depths_mm})
+        row["_depths_cache"] = (source, depths_cm)
+        return depths_cm
 
-    def _plot_profiles_for_row(self, row: Dict[str, object]) -> None:
+    def _plot_profiles_for_row(self, row: Dict[str, object], curves: List[Curve], pvar: str, psec: str) -> None:
         """
-        Tracer les profils d'une ligne (inplane/crossplane), regroupés par profondeur.
+        Préparer les profils d'une ligne (inplane/crossplane), regroupés par profondeur.
 
         Implémente les correctifs :
           - On segmente toujours par profondeur trouvée dans le MCC.
@@ -1788,50 +2851,57 @@ class MCCPlotterGUI(tk.Tk):
 
         :param row: Ligne/fichier à tracer (contient '_profiles' et métadonnées).
         :type row: Dict[str, object]
+        :param curves: Liste de courbes à compléter (tracée ensuite par `_draw_curves`).
+        :type curves: List[Curve]
+        :param pvar: Paramètre variable (couleur & légende), lu une fois par tracé.
+        :type pvar: str
+        :param psec: Paramètre secondaire (marqueurs), lu une fois par tracé.
+        :type psec: str
         :return: None
         :rtype: None
         """
         profiles = row.get("_profiles") or {}
-        want_in = bool(self.profile_inplane_var.get())
-        want_cross = bool(self.profile_crossplane_var.get())
-
         inplane_list = profiles.get("inplane", [])
         cross_list = profiles.get("crossplane", [])
+        have_in = bool(inplane_list) and bool(self.profile_inplane_var.get())
+        have_cross = bool(cross_list) and bool(self.profile_crossplane_var.get())
+        if not (have_in or have_cross):
+            return  # aucune orientation à tracer : ni couleur ni légende à résoudre
 
         # Déterminer les profondeurs à tracer : filtre UI si rempli, sinon tout
         depth_csv = str(row.get("depth", "")).strip()
         if depth_csv:
-            target_cm_list = _parse_depth_csv_cm(depth_csv)
+            # Parsing mémorisé sur la ligne tant que la cellule 'depth' ne change pas
+            cached = row.get("_target_cm_cache")
+            if cached is None or cached[0] != depth_csv:
+                cached = row["_target_cm_cache"] = (depth_csv, _parse_depth_csv_cm(depth_csv))
+            target_cm_list = cached[1]
         else:
             target_cm_list = self._all_depths_from_profiles(row)
 
-        def match_depths(seq: List[Dict[str, object]], target_cm: float) -> List[Tuple[List[float], List[float]]]:
-            """
-            Filtrer les courbes dont la profondeur ≈ target_cm.
-
-            :param seq: Liste d'objets courbe {'depth_mm','xs','ys'}.
-            :type seq: List[Dict[str, object]]
-            :param target_cm: Profondeur visée (cm).
-            :type target_cm: float
-            :return: Liste de paires (xs, ys).
-            :rtype: List[Tuple[List[float], List[float]]]
-            """
-            out: List[Tuple[List[float], List[float]]] = []
-            for e in seq:
-                dmm = e.get("depth_mm")
-                if dmm is None:
-                    continue
-                dcm = dmm / 10.0
-                if abs(dcm - target_cm) <= 0.05:
-                    out.append((e["xs"], e["ys"]))
-            return out
+        in_by_depth = _DepthIndex(inplane_list) if have_in else None
+        cross_by_depth = _DepthIndex(cross_list) if have_cross else None
 
-        both_orients = bool(inplane_list) and bool(cross_list) and want_in and want_cross
-        pvar = self.color_var_name.get().strip()
-        psec = self.marker_var_name.get().strip()
+        both_orients = have_in and have_cross
+        if both_orients:
+            linestyle_in, linestyle_cross = FORCED_INPLANE_LINESTYLE, FORCED_CROSSPLANE_LINESTYLE
+        else:
+            linestyle_in = linestyle_cross = str(row.get("linestyle", DEFAULT_LINESTYLE))
+        # Clés constantes sur toute la ligne (hors 'depth' / 'fov', résolus par profondeur)
+        row_color_key = str(row.get(pvar, "")) if pvar else ""
+        row_marker_key = str(row.get(psec, "")) if psec else ""
+        # ... et couleur / marqueur correspondants, alloués une seule fois
+        fixed_color = fixed_marker = None
+        if target_cm_list:
+            if pvar not in ("depth", "fov"):
+                fixed_color = self._get_color_for(pvar or "default", row_color_key)
+            if not psec:
+                fixed_marker = "o"
+            elif psec not in ("depth", "fov"):
+                fixed_marker = self._get_marker_for(psec, row_marker_key)
 
         for depth_cm in target_cm_list:
-            depth_cm_str = f"{depth_cm:g}"
+            depth_cm_str = self._depth_str(depth_cm)
 
             # --- Sélection des clés couleur/marker au niveau de la profondeur ---
             if pvar == "depth":
@@ -1841,7 +2911,7 @@ class MCCPlotterGUI(tk.Tk):
                 color_key = self._fov_value_at_depth(row, depth_cm)
                 color_ns = "fov@depth"  # espace de noms séparé
             else:
-                color_key = str(row.get(pvar, "")) if pvar else ""
+                color_key = row_color_key
                 color_ns = pvar or "default"
 
             if psec == "depth":
@@ -1851,74 +2921,101 @@ class MCCPlotterGUI(tk.Tk):
                 marker_key = self._fov_value_at_depth(row, depth_cm)
                 marker_ns = "fov@depth"
             else:
-                marker_key = str(row.get(psec, "")) if psec else ""
+                marker_key = row_marker_key
                 marker_ns = psec
 
-            color = self._get_color_for(color_ns, color_key)
-            marker = self._get_marker_for(marker_ns, marker_key) if psec else "o"
+            color = fixed_color or self._get_color_for(color_ns, color_key)
+            marker = fixed_marker or self._get_marker_for(marker_ns, marker_key)
 
             # ---- Légendes ----
             if pvar == "depth":
                 base = depth_cm_str
             elif pvar == "fov":
-                base = f"{color_key} @ {depth_cm:g} cm"
+                base = f"{color_key} @ {depth_cm_str} cm"
             else:
-                base = str(row.get(pvar, "")) if pvar else "(valeur manquante)"
+                base = row_color_key if pvar else "(valeur manquante)"
 
-            label_in = self._legend_for(row, base, depth_cm, "Inplane" if both_orients else "")
-            label_cross = self._legend_for(row, base, depth_cm, "Crossplane" if both_orients else "")
+            label_in = self._legend_for(row, base, depth_cm, "Inplane" if both_orients else "", pvar)
+            label_cross = self._legend_for(row, base, depth_cm, "Crossplane" if both_orients else "", pvar)
 
-            # ---- Tracés ----
-            if want_in and inplane_list:
-                for xs_raw, ys_raw in match_depths(inplane_list, depth_cm):
+            # ---- Tracés (une seule entrée de légende par profondeur/orientation) ----
+            if have_in:
+                for i, (xs_raw, ys_raw) in enumerate(in_by_depth.match(depth_cm)):
                     xs, ys = self._transform_xy(xs_raw, ys_raw, row)
-                    linestyle = FORCED_INPLANE_LINESTYLE if both_orients else str(row.get("linestyle", DEFAULT_LINESTYLE))
-                    plt.plot(
-                        xs, ys,
-                        linestyle=linestyle,
-                        marker=marker,
-                        markersize=MARKERSIZE,
-                        linewidth=LINEWIDTH,
-                        color=color,
-                        label=label_in,
-                    )
-
-            if want_cross and cross_list:
-                for xs_raw, ys_raw in match_depths(cross_list, depth_cm):
+                    curves.append((xs, ys, color, linestyle_in, marker, label_in if i == 0 else "_nolegend_"))
+
+            if have_cross:
+                for i, (xs_raw, ys_raw) in enumerate(cross_by_depth.match(depth_cm)):
                     xs, ys = self._transform_xy(xs_raw, ys_raw, row)
-                    linestyle = FORCED_CROSSPLANE_LINESTYLE if both_orients else str(row.get("linestyle", DEFAULT_LINESTYLE))
-                    plt.plot(
-                        xs, ys,
-                        linestyle=linestyle,
-                        marker=marker,
-                        markersize=MARKERSIZE,
-                        linewidth=LINEWIDTH,
-                        color=color,
-                        label=label_cross,
-                    )
-
-    def _plot_common(self, included_rows: List[Dict[str, object]]) -> None:
+                    curves.append((xs, ys, color, linestyle_cross, marker, label_cross if i == 0 else "_nolegend_"))
+
+    def _draw_curves(self, ax: plt.Axes, curves: List[Curve]) -> Tuple[List[Line2D], List[str]]:
+        """
+        Tracer les courbes en lot : une LineCollection (+ un artiste marqueurs)
+        par style (couleur, style de ligne, marqueur) au lieu d'un Line2D par
+        courbe.
+
+        :param ax: Axes cible.
+        :type ax: plt.Axes
+        :param curves: Courbes à tracer.
+        :type curves: List[Curve]
+        :return: (poignées, libellés) de légende, une entrée par (libellé, style).
+        :rtype: Tuple[List[Line2D], List[str]]
+        """
+        groups: Dict[Tuple[str, str, str], List[np.ndarray]] = {}
+        entries: Dict[Tuple[str, str, str, str], None] = {}
+        for xs, ys, color, linestyle, marker, label in curves:
+            style = (color, linestyle, marker)
+            groups.setdefault(style, []).append(np.column_stack([xs, ys]))
+            if label and not label.startswith("_"):  # même règle que Matplotlib
+                entries.setdefault((label,) + style, None)
+
+        for (color, linestyle, marker), segments in groups.items():
+            ax.add_collection(LineCollection(segments, colors=color, linestyles=linestyle, linewidths=LINEWIDTH))
+            if marker:
+                points = np.concatenate(segments)
+                ax.plot(points[:, 0], points[:, 1], linestyle="none", marker=marker,
+                        markersize=MARKERSIZE, color=color)
+        ax.autoscale_view()
+
+        handles = [
+            Line2D([], [], color=color, linestyle=linestyle, marker=marker,
+                   markersize=MARKERSIZE, linewidth=LINEWIDTH)
+            for _label, color, linestyle, marker in entries
+        ]
+        labels = [label for label, *_style in entries]
+        return handles, labels
+
+    def _plot_common(self, included_rows: List[Dict[str, object]], ax: plt.Axes) -> None:
         """
         Tracer PDD ou Profils pour un ensemble de lignes incluses.
 
         :param included_rows: Lignes marquées 'include=True'.
         :type included_rows: List[Dict[str, object]]
+        :param ax: Axes cible (figure interactive ou figure Agg d'export).
+        :type ax: plt.Axes
         :return: None
         :rtype: None
         """
+        self._fov_cache.clear()  # les lignes ont pu être éditées depuis le dernier tracé
+        self._depth_str_cache.clear()
+        curves: List[Curve] = []
+        # Paramètres de style résolus une fois pour tout le tracé
+        pvar = self.color_var_name.get().strip()
+        psec = self.marker_var_name.get().strip()
         if self.measure_type.get() == MEASURE_PROFILE:
             for row in included_rows:
                 if not row.get("_profiles"):
                     continue
-                self._plot_profiles_for_row(row)
+                self._plot_profiles_for_row(row, curves, pvar, psec)
         else:
+            color_ns = "fov@depth" if pvar == "fov" else (pvar or "default")
+            marker_ns = "fov@depth" if psec == "fov" else psec
             for row in included_rows:
                 xs_raw, ys_raw = (row.get("_pdd") or (None, None))
                 if xs_raw is None:
                     continue
                 xs, ys = self._transform_xy(xs_raw, ys_raw, row)
-                pvar = self.color_var_name.get().strip()
-                psec = self.marker_var_name.get().strip()
 
                 if pvar == "depth":
                     label = str(row.get("depth", ""))
@@ -1927,31 +3024,90 @@ class MCCPlotterGUI(tk.Tk):
                 else:
                     label = str(row.get(pvar, "")) if pvar else "(valeur manquante)"
 
-                color_ns = "fov@depth" if pvar == "fov" else (pvar or "default")
                 color = self._get_color_for(color_ns, label)
 
-                marker_ns = "fov@depth" if psec == "fov" else psec
                 marker_val = str(row.get(psec, "")) if psec else ""
                 marker = self._get_marker_for(marker_ns, marker_val) if psec else "o"
 
-                plt.plot(
-                    xs, ys,
-                    linestyle=str(row.get("linestyle", DEFAULT_LINESTYLE)),
-                    marker=marker,
-                    markersize=MARKERSIZE,
-                    linewidth=LINEWIDTH,
-                    color=color,
-                    label=label,
-                )
-
-        self._apply_plot_labels()
-        legend = plt.legend(title=self._param_label(self.color_var_name.get()), frameon=True)
+                linestyle = str(row.get("linestyle", DEFAULT_LINESTYLE))
+                curves.append((xs, ys, color, linestyle, marker, label))
+
+        handles, labels = self._draw_curves(ax, curves)
+        self._apply_plot_labels(ax)
+        legend = ax.legend(
+            handles, labels, title=self._param_label(self.color_var_name.get()), frameon=True, loc=LEGEND_LOC
+        ) if handles else None
         if legend and legend.get_frame():
             legend.get_frame().set_edgecolor("#aaaaaa")
             legend.get_frame().set_linewidth(0.8)
 
     # --------- Actions ---------
 
+    def _included_rows(self) -> List[Dict[str, object]]:
+        """
+        Lignes cochées « Inclure », dans l'ordre du tableau.
+
+        :return: Lignes à tracer.
+        :rtype: List[Dict[str, object]]
+        """
+        return [row for row in self.rows if row["include"]]
+
+    def _plot_state(self, included_rows: List[Dict[str, object]]) -> tuple:
+        """
+        Instantané de tout ce qui détermine la figure (options + lignes incluses).
+
+        :param included_rows: Lignes incluses.
+        :type included_rows: List[Dict[str, object]]
+        :return: Tuple comparable : égal si et seulement si la figure serait identique.
+        :rtype: tuple
+        """
+        # Identité stable : chemin résolu + fichier parsé (chemin, mtime), jamais id()
+        row_keys = ("_file_key", "_file", "x_shift", "y_scale", "y_offset", "linestyle") + PARAM_KEYS
+        return (
+            self.measure_type.get(), self.color_var_name.get(), self.marker_var_name.get(),
+            bool(self.normalize_var.get()), bool(self.profile_inplane_var.get()),
+            bool(self.profile_crossplane_var.get()), self.custom_title_var.get(),
+            tuple(tuple(row.get(k) for k in row_keys) for row in included_rows),
+        )
+
+    def _reusable_figure(self, state: tuple) -> Optional[Figure]:
+        """
+        Figure Agg du dernier export, si elle a été rendue pour `state`.
+
+        Seules les figures rendues par `export_png` sont réutilisées : la
+        fenêtre interactive peut avoir été zoomée ou retouchée par l'utilisateur.
+
+        :param state: Résultat de `_plot_state`.
+        :type state: tuple
+        :return: Figure réutilisable ou None.
+        :rtype: Optional[Figure]
+        """
+        if self._export_figure is None:
+            return None
+        if self._export_figure[0] != state:
+            self._export_figure = None  # périmée : libérée sans attendre le prochain export
+            return None
+        return self._export_figure[1]
+
+    @staticmethod
+    def _warn_if_empty(rows: List[Dict[str, object]], title: str, message: str) -> bool:
+        """
+        Avertir l'utilisateur si aucune ligne n'est à tracer.
+
+        :param rows: Lignes incluses.
+        :type rows: List[Dict[str, object]]
+        :param title: Titre de la boîte d'avertissement.
+        :type title: str
+        :param message: Message affiché.
+        :type message: str
+        :return: True si la liste est vide (action à abandonner).
+        :rtype: bool
+        """
+        if rows:
+            return False
+        messagebox.showwarning(title, message)
+        return True
+
     def plot(self) -> None:
         """
         Afficher la figure dans une fenêtre Matplotlib interactive.
@@ -1959,12 +3115,12 @@ class MCCPlotterGUI(tk.Tk):
         :return: None
         :rtype: None
         """
-        included = [row for row in self.rows if row["include"]]
-        if not included:
-            messagebox.showwarning("Rien à tracer", 'Ajoute des fichiers et/ou coche "Inclure".')
+        included = self._included_rows()
+        if self._warn_if_empty(included, "Rien à tracer", 'Ajoute des fichiers et/ou coche "Inclure".'):
             return
-        plt.figure(figsize=PLOT_SIZE)
-        self._plot_common(included)
+        _fig, ax = plt.subplots(figsize=PLOT_SIZE)
+        with self._plotting():
+            self._plot_common(included, ax)
         plt.show()
 
     def export_png(self) -> None:
@@ -1974,9 +3130,8 @@ class MCCPlotterGUI(tk.Tk):
         :return: None
         :rtype: None
         """
-        included = [row for row in self.rows if row["include"]]
-        if not included:
-            messagebox.showwarning("Export", 'Rien à exporter. Ajoute des fichiers et/ou coche "Inclure".')
+        included = self._included_rows()
+        if self._warn_if_empty(included, "Export", 'Rien à exporter. Ajoute des fichiers et/ou coche "Inclure".'):
             return
         save_path = filedialog.asksaveasfilename(
             title=EXPORT_DIALOG_TITLE,
@@ -1986,15 +3141,20 @@ class MCCPlotterGUI(tk.Tk):
         )
         if not save_path:
             return
-        fig = plt.figure(figsize=PLOT_SIZE)
         try:
-            self._plot_common(included)
+            state = self._plot_state(included)
+            fig = self._reusable_figure(state)
+            if fig is None:
+                # Figure hors pyplot rendue directement par Agg (pas de fenêtre Tk)
+                fig = Figure(figsize=PLOT_SIZE)
+                FigureCanvasAgg(fig)
+                with self._plotting():
+                    self._plot_common(included, fig.add_subplot(111))
+                self._export_figure = (state, fig)
             fig.savefig(save_path, dpi=EXPORT_DPI)
             messagebox.showinfo("Export", f"Figure enregistrée :\n{save_path}")
         except Exception as exc:
             messagebox.showerror("Export", f"Échec de l'enregistrement : {exc}")
-        finally:
-            plt.close(fig)
 
 
 # ======================== Entrée =============================================